@@ -4,16 +4,108 @@
 """
 
 import os
+import copy
 import json
+import heapq
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _quartiles(values: np.ndarray) -> np.ndarray:
+    """
+    第1四分位数・中央値・第3四分位数を1回の部分選択で計算
+    np.percentileの線形補間と同じ値を返す
+    
+    Args:
+        values: 1次元の数値配列（NaNを含まないこと）
+    
+    Returns:
+        ndarray: [q25, median, q75]
+    """
+    positions = (len(values) - 1) * np.array([0.25, 0.5, 0.75])
+    lower = np.floor(positions).astype(int)
+    upper = np.ceil(positions).astype(int)
+    
+    # 必要な順位の要素だけを確定させる（全体のソートは不要）
+    partitioned = np.partition(values, np.union1d(lower, upper))
+    return partitioned[lower] + (partitioned[upper] - partitioned[lower]) * (positions - lower)
+
+
+def _read_bytes(path: str) -> bytes:
+    """ファイルをバイト列として読み込み"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+# 型ごとのJSON互換値への変換関数
+_JSON_CONVERTERS = {
+    pd.Timestamp: lambda obj: obj.isoformat(),
+    np.int32: int,
+    np.int64: int,
+    np.float32: float,
+    np.float64: float,
+    np.ndarray: lambda obj: obj.tolist()
+}
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    orjsonが直接扱えない型をJSON互換の値に変換
+    
+    Args:
+        obj: 変換対象オブジェクト
+    
+    Returns:
+        Any: JSON互換の値
+    """
+    converter = _JSON_CONVERTERS.get(type(obj))
+    if converter is not None:
+        return converter(obj)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _loads(raw: bytes) -> Any:
+    """
+    JSONバイト列をデコード（orjsonが利用可能な場合は高速デコード）
+    
+    Args:
+        raw: JSONバイト列
+    
+    Returns:
+        Any: デコード結果
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # 標準jsonが出力するNaN/Infinityはorjsonでは読めないためフォールバック
+            pass
+    return json.loads(raw)
+
+
 class BacktestAggregator:
     """バックテスト結果集計クラス"""
     
+    # 集計結果キャッシュの最大保持件数
+    CACHE_SIZE = 8
+    # 個別結果ファイル読み込みの並列数
+    READ_WORKERS = 8
+    # 集計用の実行サマリー（1実行1行のJSON Lines、追記専用）
+    SUMMARY_FILENAME = "summary.jsonl"
+    
     def __init__(self, results_dir: str = "results"):
         """
         初期化
@@ -28,6 +120,41 @@ class BacktestAggregator:
         os.makedirs(results_dir, exist_ok=True)
         os.makedirs(os.path.join(results_dir, "individual"), exist_ok=True)
         os.makedirs(os.path.join(results_dir, "aggregated"), exist_ok=True)
+        
+        # 個別結果ディレクトリの更新時刻をキーにした集計結果キャッシュ
+        self._aggregate_cache: OrderedDict = OrderedDict()
+    
+    def _cache_key(self, *args) -> Optional[tuple]:
+        """
+        個別結果ディレクトリの更新時刻を含むキャッシュキーを生成
+        
+        Args:
+            *args: キーに含める値
+        
+        Returns:
+            Optional[tuple]: キャッシュキー（ディレクトリが参照できない場合はNone）
+        """
+        try:
+            mtime = os.stat(os.path.join(self.results_dir, "individual")).st_mtime_ns
+        except OSError:
+            return None
+        return args + (mtime,)
+    
+    def _cache_get(self, cache: OrderedDict, key: Optional[tuple]):
+        """キャッシュから取得（見つからない場合はNone）"""
+        if key is None or key not in cache:
+            return None
+        cache.move_to_end(key)
+        return cache[key]
+    
+    def _cache_put(self, cache: OrderedDict, key: Optional[tuple], value):
+        """キャッシュに保存（上限を超えた場合は最も古いものを削除）"""
+        if key is None:
+            return
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
     
     def _convert_timestamps(self, obj):
         """
@@ -39,30 +166,21 @@ class BacktestAggregator:
         Returns:
             変換されたオブジェクト
         """
-        if isinstance(obj, pd.Timestamp):
-            return obj.isoformat()
+        converter = _JSON_CONVERTERS.get(type(obj))
+        if converter is not None:
+            return converter(obj)
         elif isinstance(obj, dict):
             return {key: self._convert_timestamps(value) for key, value in obj.items()}
         elif isinstance(obj, list):
             return [self._convert_timestamps(item) for item in obj]
-        elif isinstance(obj, (np.integer, np.floating)):
-            return float(obj)
-        elif isinstance(obj, np.int32):
-            return int(obj)
-        elif isinstance(obj, np.int64):
-            return int(obj)
-        elif isinstance(obj, np.float32):
-            return float(obj)
-        elif isinstance(obj, np.float64):
-            return float(obj)
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
+        elif isinstance(obj, np.generic):
+            return obj.item()
         else:
             return obj
     
     def save_individual_result(self, strategy: str, run_id: int, 
                              random_seed: int, stocks: List[str], 
-                             results: Dict[str, Any]) -> str:
+                             results: Dict[str, Any], compact: bool = True) -> str:
         """
         個別バックテスト結果を保存
         
@@ -72,6 +190,7 @@ class BacktestAggregator:
             random_seed: 乱数シード
             stocks: 使用銘柄リスト
             results: バックテスト結果
+            compact: インデントなしで保存するか（Falseの場合は確認用に整形）
         
         Returns:
             str: 保存されたファイルパス
@@ -87,12 +206,32 @@ class BacktestAggregator:
             "random_seed": random_seed,
             "timestamp": timestamp,
             "stocks": stocks,
-            "results": self._convert_timestamps(results)
+            "results": results
         }
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                # numpy配列・スカラーはorjson側で直接シリアライズ
+                option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                if not compact:
+                    option |= orjson.OPT_INDENT_2
+                payload = orjson.dumps(save_data, default=_json_default, option=option)
+            else:
+                save_data["results"] = self._convert_timestamps(results)
+                if compact:
+                    text = json.dumps(save_data, ensure_ascii=False, separators=(',', ':'))
+                else:
+                    text = json.dumps(save_data, ensure_ascii=False, indent=2)
+                payload = text.encode('utf-8')
+            
+            # シリアライズ済みのバイト列を1回で書き込み
+            with open(filepath, 'wb', buffering=1 << 16) as f:
+                f.write(payload)
+            
+            self._append_run_summary(filename, save_data)
+            
+            # 更新時刻の分解能内での追加にも対応するため明示的に破棄
+            self._aggregate_cache.clear()
             
             self.logger.info(f"個別結果保存: {filepath}")
             return filepath
@@ -101,6 +240,81 @@ class BacktestAggregator:
             self.logger.error(f"個別結果保存エラー: {e}")
             return ""
     
+    def _append_run_summary(self, filename: str, save_data: Dict[str, Any]):
+        """
+        実行サマリーに1行追記（集計に必要なスカラー指標と銘柄リストのみ）
+        
+        Args:
+            filename: 個別結果ファイル名
+            save_data: 個別結果の保存データ
+        """
+        row = {key: value for key, value in save_data.items() if key != "results"}
+        row["file"] = filename
+        row["results"] = {
+            key: value.item() if isinstance(value, np.generic) else value
+            for key, value in save_data["results"].items()
+            if value is None or isinstance(value, (bool, int, float, str, np.generic))
+        }
+        line = json.dumps(row, ensure_ascii=False) + "\n"
+        
+        # 1回の書き込みで追記し、並列実行時の行の混在を防ぐ
+        summary_path = os.path.join(self.results_dir, "individual", self.SUMMARY_FILENAME)
+        with open(summary_path, 'ab') as f:
+            f.write(line.encode('utf-8'))
+    
+    def load_run_summaries(self, strategy: str = None) -> List[Dict[str, Any]]:
+        """
+        集計用の実行サマリーを読み込み
+        
+        サマリーに記録済みの実行は1ファイルから読み込み、記録のない個別結果
+        （サマリー導入前の結果など）のみ個別ファイルを読み込む。
+        個別結果ファイルが削除された実行は対象外とする。
+        
+        Args:
+            strategy: 戦略名（Noneの場合は全戦略）
+        
+        Returns:
+            List[Dict]: 実行サマリーリスト（個別結果と同じ構造、resultsはスカラー指標のみ）
+        """
+        individual_dir = os.path.join(self.results_dir, "individual")
+        results = []
+        
+        try:
+            with os.scandir(individual_dir) as it:
+                filenames = {
+                    entry.name for entry in it
+                    if entry.name.endswith('.json')
+                    and (not strategy or entry.name.startswith(strategy))
+                    and entry.is_file()
+                }
+            
+            summaries = {}
+            summary_path = os.path.join(individual_dir, self.SUMMARY_FILENAME)
+            if os.path.exists(summary_path):
+                with open(summary_path, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        row = _loads(line)
+                        if row.get('file') in filenames:
+                            summaries[row['file']] = row
+            
+            # サマリーに記録のない個別結果を読み込み
+            missing = sorted(filenames - summaries.keys())
+            if missing:
+                paths = [os.path.join(individual_dir, filename) for filename in missing]
+                with ThreadPoolExecutor(max_workers=min(self.READ_WORKERS, len(paths))) as executor:
+                    blobs = list(executor.map(_read_bytes, paths))
+                results.extend(_loads(blob) for blob in blobs)
+            
+            results.extend(summaries.values())
+            results.sort(key=lambda x: x['run_id'])
+            
+        except Exception as e:
+            self.logger.error(f"実行サマリー読み込みエラー: {e}")
+        
+        return results
+    
     def load_individual_results(self, strategy: str = None) -> List[Dict[str, Any]]:
         """
         個別バックテスト結果を読み込み
@@ -115,17 +329,23 @@ class BacktestAggregator:
         results = []
         
         try:
-            for filename in os.listdir(individual_dir):
-                if not filename.endswith('.json'):
-                    continue
-                
-                if strategy and not filename.startswith(strategy):
-                    continue
-                
-                filepath = os.path.join(individual_dir, filename)
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    results.append(data)
+            with os.scandir(individual_dir) as it:
+                entries = [
+                    entry for entry in it
+                    if entry.name.endswith('.json')
+                    and (not strategy or entry.name.startswith(strategy))
+                    and entry.is_file()
+                ]
+            
+            # ファイル読み込みはGILを解放するためスレッドで重ね合わせる
+            paths = [entry.path for entry in entries]
+            if len(paths) > 1:
+                with ThreadPoolExecutor(max_workers=min(self.READ_WORKERS, len(paths))) as executor:
+                    blobs = list(executor.map(_read_bytes, paths))
+            else:
+                blobs = [_read_bytes(path) for path in paths]
+            
+            results = [_loads(blob) for blob in blobs]
             
             # 実行IDでソート
             results.sort(key=lambda x: x['run_id'])
@@ -147,8 +367,31 @@ class BacktestAggregator:
         Returns:
             Dict: 集計結果
         """
-        individual_results = self.load_individual_results(strategy)
+        # 呼び出し元での変更がキャッシュに波及しないよう、取得・保存ともコピーを渡す
+        cache_key = self._cache_key(strategy, min_runs)
+        cached = self._cache_get(self._aggregate_cache, cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        individual_results = self.load_run_summaries(strategy)
+        aggregated = self._aggregate_from_results(strategy, individual_results, min_runs)
+        
+        self._cache_put(self._aggregate_cache, cache_key, copy.deepcopy(aggregated))
+        return aggregated
+    
+    def _aggregate_from_results(self, strategy: str, individual_results: List[Dict[str, Any]],
+                                min_runs: int = 1) -> Dict[str, Any]:
+        """
+        読み込み済みの個別結果を集計
         
+        Args:
+            strategy: 戦略名
+            individual_results: 個別結果リスト（実行IDでソート済み）
+            min_runs: 最小実行回数
+        
+        Returns:
+            Dict: 集計結果
+        """
         if len(individual_results) < min_runs:
             self.logger.warning(f"戦略 {strategy} の実行回数({len(individual_results)})が最小回数({min_runs})未満")
             return {}
@@ -168,30 +411,50 @@ class BacktestAggregator:
             "aggregation_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
         
-        # 各指標の統計計算
-        for metric in metrics:
-            values = []
-            for result in individual_results:
-                if 'results' in result and metric in result['results']:
-                    values.append(result['results'][metric])
-            
-            if values:
-                aggregated[f"{metric}_mean"] = np.mean(values)
-                aggregated[f"{metric}_std"] = np.std(values)
-                aggregated[f"{metric}_min"] = np.min(values)
-                aggregated[f"{metric}_max"] = np.max(values)
-                aggregated[f"{metric}_median"] = np.median(values)
-                aggregated[f"{metric}_q25"] = np.percentile(values, 25)
-                aggregated[f"{metric}_q75"] = np.percentile(values, 75)
-        
-        # 銘柄使用頻度の集計
-        stock_usage = {}
-        for result in individual_results:
-            for stock in result.get('stocks', []):
-                stock_usage[stock] = stock_usage.get(stock, 0) + 1
-        
-        aggregated['stock_usage'] = stock_usage
-        aggregated['unique_stocks'] = len(stock_usage)
+        # 各指標の値を (実行回数, 指標数) の2次元配列にまとめる（欠損はNaN）
+        values = np.full((len(individual_results), len(metrics)), np.nan)
+        for i, result in enumerate(individual_results):
+            run_results = result.get('results', {})
+            for j, metric in enumerate(metrics):
+                if metric in run_results:
+                    values[i, j] = run_results[metric]
+        
+        # 値が1つもない指標は集計対象外
+        valid = ~np.isnan(values).all(axis=0)
+        valid_metrics = [metric for metric, ok in zip(metrics, valid) if ok]
+        values = values[:, valid]
+        
+        # 各指標の統計計算（列方向に一括で集計）
+        aggregated['metrics'] = {}
+        if valid_metrics:
+            means = np.nanmean(values, axis=0)
+            stds = np.nanstd(values, axis=0)
+            mins = np.nanmin(values, axis=0)
+            maxs = np.nanmax(values, axis=0)
+            q25s, medians, q75s = np.array([
+                _quartiles(column[~np.isnan(column)]) for column in values.T
+            ]).T
+        
+            aggregated['metrics'] = {
+                metric: {
+                    'mean': mean,
+                    'std': std,
+                    'min': vmin,
+                    'max': vmax,
+                    'median': median,
+                    'q25': q25,
+                    'q75': q75
+                }
+                for metric, mean, std, vmin, vmax, median, q25, q75 in zip(
+                    valid_metrics, means, stds, mins, maxs, medians, q25s, q75s)
+            }
+        
+        # 銘柄使用頻度の集計（初出順を保持したまま一括カウント）
+        all_stocks = list(chain.from_iterable(result.get('stocks', ()) for result in individual_results))
+        stock_counts = pd.Series(all_stocks, dtype=object).value_counts(sort=False)
+        
+        aggregated['stock_usage'] = stock_counts.to_dict()
+        aggregated['unique_stocks'] = int(stock_counts.size)
         
         self.logger.info(f"結果集計完了: {strategy}, {len(individual_results)}回実行")
         return aggregated
@@ -255,7 +518,11 @@ class BacktestAggregator:
     
     def _generate_html_report(self, strategies: List[str]) -> str:
         """HTMLレポート内容を生成"""
-        html = f"""
+        # 文字列の連結を繰り返さず、部品をリストに集めて最後に結合する
+        parts: List[str] = []
+        append = parts.append
+        
+        append(f"""
 <!DOCTYPE html>
 <html>
 <head>
@@ -277,20 +544,25 @@ class BacktestAggregator:
         <h1>バックテスト集計レポート</h1>
         <p>生成日時: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
     </div>
-"""
+""")
+        
+        # 実行サマリーは1回だけ読み込み、戦略ごとに振り分けて集計する
+        results_by_strategy: Dict[str, List[Dict[str, Any]]] = {}
+        for result in self.load_run_summaries():
+            results_by_strategy.setdefault(result.get('strategy', ''), []).append(result)
         
         for strategy in strategies:
-            aggregated = self.aggregate_results(strategy)
+            aggregated = self._aggregate_from_results(strategy, results_by_strategy.get(strategy, []))
             if not aggregated:
-                html += f"""
+                append(f"""
     <div class="strategy-section">
         <h2>{strategy}</h2>
         <p class="error">データが不足しています</p>
     </div>
-"""
+""")
                 continue
             
-            html += f"""
+            append(f"""
     <div class="strategy-section">
         <h2>{strategy}</h2>
         <p>実行回数: {aggregated['total_runs']}回</p>
@@ -306,24 +578,25 @@ class BacktestAggregator:
                 <th>最大</th>
                 <th>中央値</th>
             </tr>
-"""
+""")
             
             # 主要指標の表示
             key_metrics = ['total_return', 'sharpe_ratio', 'max_drawdown', 'win_rate']
             for metric in key_metrics:
-                if f"{metric}_mean" in aggregated:
-                    html += f"""
+                stats = aggregated['metrics'].get(metric)
+                if stats:
+                    append(f"""
             <tr>
                 <td>{metric}</td>
-                <td>{aggregated[f'{metric}_mean']:.4f}</td>
-                <td>{aggregated[f'{metric}_std']:.4f}</td>
-                <td>{aggregated[f'{metric}_min']:.4f}</td>
-                <td>{aggregated[f'{metric}_max']:.4f}</td>
-                <td>{aggregated[f'{metric}_median']:.4f}</td>
+                <td>{stats['mean']:.4f}</td>
+                <td>{stats['std']:.4f}</td>
+                <td>{stats['min']:.4f}</td>
+                <td>{stats['max']:.4f}</td>
+                <td>{stats['median']:.4f}</td>
             </tr>
-"""
+""")
             
-            html += """
+            append("""
         </table>
         
         <h3>銘柄使用頻度（上位20銘柄）</h3>
@@ -333,32 +606,32 @@ class BacktestAggregator:
                     <th>銘柄</th>
                     <th>使用回数</th>
                 </tr>
-"""
+""")
             
             # 銘柄使用頻度の表示（上位20銘柄）
             stock_usage = aggregated.get('stock_usage', {})
-            sorted_stocks = sorted(stock_usage.items(), key=lambda x: x[1], reverse=True)[:20]
+            sorted_stocks = heapq.nlargest(20, stock_usage.items(), key=lambda x: x[1])
             
             for stock, count in sorted_stocks:
-                html += f"""
+                append(f"""
                 <tr>
                     <td>{stock}</td>
                     <td>{count}</td>
                 </tr>
-"""
+""")
             
-            html += """
+            append("""
             </table>
         </div>
     </div>
-"""
+""")
         
-        html += """
+        append("""
 </body>
 </html>
-"""
+""")
         
-        return html
+        return ''.join(parts)
     
     def get_performance_summary(self, strategy: str) -> Dict[str, float]:
         """
@@ -374,10 +647,11 @@ class BacktestAggregator:
         if not aggregated:
             return {}
         
+        metrics = aggregated.get('metrics', {})
         return {
-            "total_return_mean": aggregated.get("total_return_mean", 0),
-            "sharpe_ratio_mean": aggregated.get("sharpe_ratio_mean", 0),
-            "max_drawdown_mean": aggregated.get("max_drawdown_mean", 0),
-            "win_rate_mean": aggregated.get("win_rate_mean", 0),
+            "total_return_mean": metrics.get("total_return", {}).get("mean", 0),
+            "sharpe_ratio_mean": metrics.get("sharpe_ratio", {}).get("mean", 0),
+            "max_drawdown_mean": metrics.get("max_drawdown", {}).get("mean", 0),
+            "win_rate_mean": metrics.get("win_rate", {}).get("mean", 0),
             "total_runs": aggregated.get("total_runs", 0)
         }
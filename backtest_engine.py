@@ -5,7 +5,7 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Callable
 import logging
 from dataclasses import dataclass
 from enum import Enum
@@ -13,11 +13,141 @@ import time
 import concurrent.futures
 from functools import partial
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """numba未導入時は関数をそのまま返すデコレータ"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 from data_loader import DataLoader
 from cache_data_loader import CacheOnlyDataLoader
 from technical_indicators import TechnicalIndicators
 from config import TRADING_RULES, INITIAL_CAPITAL
 
+NANOSECONDS_PER_DAY = 86_400_000_000_000
+
+@njit(cache=True)
+def _performance_stats(equity: np.ndarray, profit_loss: np.ndarray):
+    """
+    エクイティカーブと取引損益から成績指標を1パスで計算
+    
+    Args:
+        equity: エクイティカーブ
+        profit_loss: 取引ごとの損益
+    
+    Returns:
+        Tuple: (最大ドローダウン, シャープレシオ, 勝ち数, 負け数, 平均利益, 平均損失)
+    """
+    # ドローダウンと日次リターンの平均・不偏分散（Welford法）
+    peak = equity[0]
+    max_drawdown = 0.0
+    n_returns = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(1, len(equity)):
+        if equity[i] > peak:
+            peak = equity[i]
+        drawdown = (equity[i] - peak) / peak
+        if drawdown < max_drawdown:
+            max_drawdown = drawdown
+        
+        r = (equity[i] - equity[i - 1]) / equity[i - 1]
+        n_returns += 1
+        delta = r - mean
+        mean += delta / n_returns
+        m2 += delta * (r - mean)
+    
+    sharpe_ratio = 0.0
+    if n_returns > 1:
+        std = np.sqrt(m2 / (n_returns - 1))
+        if std > 0:
+            sharpe_ratio = mean / std * np.sqrt(252.0)
+    
+    # 勝ち・負け取引の件数と平均
+    winning_trades = 0
+    losing_trades = 0
+    total_profit = 0.0
+    total_loss = 0.0
+    for value in profit_loss:
+        if value > 0:
+            winning_trades += 1
+            total_profit += value
+        elif value < 0:
+            losing_trades += 1
+            total_loss += value
+    
+    avg_profit = total_profit / winning_trades if winning_trades > 0 else 0.0
+    avg_loss = total_loss / losing_trades if losing_trades > 0 else 0.0
+    
+    return max_drawdown, sharpe_ratio, winning_trades, losing_trades, avg_profit, avg_loss
+
+@njit(cache=True, nogil=True)
+def _simulate_single_stock(close: np.ndarray, timestamps: np.ndarray, entry_codes: np.ndarray,
+                           exit_codes: np.ndarray, strategy_code: int, max_holding_days: int):
+    """
+    単一銘柄のエントリー・エグジット状態遷移を実行
+    
+    Args:
+        close: 終値
+        timestamps: 日時（ナノ秒のint64）
+        entry_codes: 日ごとのエントリー理由コード（0はエントリーなし）
+        exit_codes: 日ごとの指標によるエグジット理由コード（0は該当なし）
+        strategy_code: 戦略コード（1: スイングトレード, 2: 中長期投資, 0: その他）
+        max_holding_days: 最大保有日数
+    
+    Returns:
+        Tuple: (エントリー行, エグジット行, エグジット理由コード) の配列
+    """
+    n = len(close)
+    entry_rows = np.empty(n // 2 + 1, dtype=np.int64)
+    exit_rows = np.empty(n // 2 + 1, dtype=np.int64)
+    exit_reasons = np.empty(n // 2 + 1, dtype=np.int64)
+    n_trades = 0
+    
+    entry_index = -1
+    entry_price = 0.0
+    for i in range(n):
+        # エントリー条件のチェック
+        if entry_index < 0:
+            if entry_codes[i] != 0:
+                entry_index = i
+                entry_price = close[i]
+            continue
+        
+        # エグジット条件のチェック（価格条件 → 戦略別条件の順）
+        current_price = close[i]
+        holding_days = (timestamps[i] - timestamps[entry_index]) // NANOSECONDS_PER_DAY
+        exit_code = 0
+        if current_price >= entry_price * 1.10:
+            exit_code = 1  # 利益確定（10%以上）
+        elif current_price <= entry_price * 0.95:
+            exit_code = 2  # 損切り（-5%以下）
+        elif strategy_code == 1:
+            if exit_codes[i] != 0:
+                exit_code = exit_codes[i]
+            elif holding_days > max_holding_days:
+                exit_code = 5
+        elif strategy_code == 2:
+            if holding_days > max_holding_days:
+                exit_code = 6
+            else:
+                exit_code = exit_codes[i]
+        
+        if exit_code != 0:
+            entry_rows[n_trades] = entry_index
+            exit_rows[n_trades] = i
+            exit_reasons[n_trades] = exit_code
+            n_trades += 1
+            entry_index = -1
+    
+    return entry_rows[:n_trades], exit_rows[:n_trades], exit_reasons[:n_trades]
+
 class TradeType(Enum):
     BUY = "buy"
     SELL = "sell"
@@ -39,16 +169,239 @@ class Trade:
     profit_loss_pct: Optional[float]
     holding_days: Optional[int]
 
+# 単一銘柄バックテストのエントリー・エグジット理由（配列上は添字で保持し、0は該当なし）
+SINGLE_STOCK_ENTRY_REASONS = (
+    None, "RSI_oversold", "MACD_golden_cross", "SMA_golden_cross",
+    "long_term_uptrend", "bollinger_oversold"
+)
+SINGLE_STOCK_EXIT_REASONS = (
+    None, "profit_taking", "stop_loss", "RSI_overbought", "MACD_dead_cross",
+    "time_exit", "long_term_exit", "trend_reversal"
+)
+# 理由コードから理由文字列への変換用配列
+_ENTRY_REASON_ARRAY = np.array(SINGLE_STOCK_ENTRY_REASONS, dtype=object)
+_EXIT_REASON_ARRAY = np.array(SINGLE_STOCK_EXIT_REASONS, dtype=object)
+
+def _trades_from_frame(trades: pd.DataFrame) -> List[Trade]:
+    """
+    取引結果のDataFrameをTradeのリストに変換
+    
+    Args:
+        trades: 取引結果（Portfolio.TRADE_COLUMNSの列を持つDataFrame）
+    
+    Returns:
+        List[Trade]: 取引リスト
+    """
+    # 行ごとの辞書を作らず、列単位で変換した値をタプルとして受け取る
+    rows = zip(*(trades[column].tolist() for column in Portfolio.TRADE_COLUMNS))
+    return [
+        Trade(symbol, entry_date, exit_date, entry_price, exit_price, quantity, TradeType.SELL,
+              strategy, entry_reason, exit_reason, profit_loss, profit_loss_pct, holding_days)
+        for (symbol, entry_date, exit_date, entry_price, exit_price, quantity,
+             profit_loss, profit_loss_pct, holding_days, strategy, entry_reason, exit_reason) in rows
+    ]
+
+def _records_from_frame(trades: pd.DataFrame) -> List[Dict]:
+    """
+    取引結果のDataFrameを行ごとの辞書のリストに変換（to_dict('records')と同じ値）
+    
+    Args:
+        trades: 取引結果のDataFrame
+    
+    Returns:
+        List[Dict]: 取引ごとの辞書
+    """
+    # 要素ごとの型変換を行うto_dict('records')を避け、列単位で変換した値を組み立てる
+    columns = trades.columns.tolist()
+    rows = zip(*(trades[column].tolist() for column in columns))
+    return [dict(zip(columns, row)) for row in rows]
+
 class Portfolio:
     """ポートフォリオ管理クラス"""
     
+    # 取引結果の列定義（結果DataFrameの列順）
+    TRADE_COLUMNS = [
+        'symbol', 'entry_date', 'exit_date', 'entry_price', 'exit_price', 'quantity',
+        'profit_loss', 'profit_loss_pct', 'holding_days', 'strategy', 'entry_reason', 'exit_reason'
+    ]
+    # 数値・日付列はNumPy配列、文字列列はリストで保持（配列は容量不足時に倍に拡張）
+    ARRAY_TRADE_COLUMNS = {
+        'entry_date': 'datetime64[ns]',
+        'exit_date': 'datetime64[ns]',
+        'entry_price': np.float64,
+        'exit_price': np.float64,
+        'quantity': np.int64,
+        'profit_loss': np.float64,
+        'profit_loss_pct': np.float64,
+        'holding_days': np.int64
+    }
+    INITIAL_TRADE_CAPACITY = 1024
+    # エクイティカーブの初期容量（容量不足時は倍に拡張）
+    INITIAL_EQUITY_CAPACITY = 8192
+    
     def __init__(self, initial_capital: float = INITIAL_CAPITAL):
         self.initial_capital = initial_capital
         self.cash = initial_capital
         self.positions: Dict[str, Dict] = {}
-        self.trades: List[Trade] = []
-        self.equity_curve: List[float] = [initial_capital]
-        self.dates: List[datetime] = [datetime.now()]
+        
+        # エクイティカーブ（事前確保した配列に日次で書き込む）
+        self._equity_values = np.empty(self.INITIAL_EQUITY_CAPACITY, dtype=np.float64)
+        self._equity_dates = np.empty(self.INITIAL_EQUITY_CAPACITY, dtype='datetime64[D]')
+        self._equity_count = 0
+        self.reset_equity_curve(initial_capital, datetime.now())
+        
+        # 取引結果の列指向ストア
+        self._trade_count = 0
+        self._trade_columns: Dict[str, object] = {
+            column: (np.empty(self.INITIAL_TRADE_CAPACITY, dtype=self.ARRAY_TRADE_COLUMNS[column])
+                     if column in self.ARRAY_TRADE_COLUMNS else [])
+            for column in self.TRADE_COLUMNS
+        }
+        
+    @property
+    def equity_curve(self) -> np.ndarray:
+        """エクイティカーブの値"""
+        return self._equity_values[:self._equity_count]
+    
+    @property
+    def dates(self) -> np.ndarray:
+        """エクイティカーブの日付"""
+        return self._equity_dates[:self._equity_count]
+    
+    def reset_equity_curve(self, value: float, date: datetime):
+        """
+        エクイティカーブを初期値1点にリセット
+        
+        Args:
+            value: 初期資産価値
+            date: 初期日付
+        """
+        self._equity_count = 0
+        self.append_equity(value, date)
+    
+    def reserve_equity(self, count: int):
+        """
+        エクイティカーブの配列を追加予定の点数分まで事前に拡張（不足時は倍々で確保）
+        
+        Args:
+            count: 追加予定の点数
+        """
+        n = self._equity_count
+        required = n + count
+        if required <= len(self._equity_values):
+            return
+        
+        capacity = max(required, len(self._equity_values) * 2)
+        self._equity_values = np.concatenate([self._equity_values[:n], np.empty(capacity - n, dtype=np.float64)])
+        self._equity_dates = np.concatenate([self._equity_dates[:n], np.empty(capacity - n, dtype='datetime64[D]')])
+    
+    def append_equity(self, value: float, date: datetime):
+        """
+        エクイティカーブに1点追加
+        
+        Args:
+            value: 総資産価値
+            date: 日付
+        """
+        n = self._equity_count
+        if n == len(self._equity_values):
+            self.reserve_equity(1)
+        
+        self._equity_values[n] = value
+        self._equity_dates[n] = date
+        self._equity_count = n + 1
+    
+    def extend_equity(self, values: np.ndarray, dates: pd.DatetimeIndex):
+        """
+        エクイティカーブに複数点をまとめて追加
+        
+        Args:
+            values: 総資産価値
+            dates: 日付
+        """
+        n = self._equity_count
+        required = n + len(values)
+        self.reserve_equity(len(values))
+        
+        self._equity_values[n:required] = values
+        self._equity_dates[n:required] = np.asarray(dates, dtype='datetime64[D]')
+        self._equity_count = required
+    
+    @property
+    def trade_count(self) -> int:
+        """記録済み取引数"""
+        return self._trade_count
+    
+    @property
+    def trades(self) -> List[Trade]:
+        """記録済み取引（列指向ストアから生成）"""
+        return _trades_from_frame(self.trades_frame())
+    
+    def _reserve_trades(self, required: int):
+        """取引の配列列を必要数まで拡張（倍々で確保）"""
+        columns = self._trade_columns
+        capacity = len(columns['profit_loss'])
+        if required <= capacity:
+            return
+        
+        capacity = max(required, capacity * 2)
+        n = self._trade_count
+        for column in self.ARRAY_TRADE_COLUMNS:
+            grown = np.empty(capacity, dtype=columns[column].dtype)
+            grown[:n] = columns[column][:n]
+            columns[column] = grown
+    
+    def record_trade(self, trade: Trade):
+        """
+        決済済み取引を記録
+        
+        Args:
+            trade: 取引情報
+        """
+        n = self._trade_count
+        columns = self._trade_columns
+        self._reserve_trades(n + 1)
+        
+        for column in self.TRADE_COLUMNS:
+            value = getattr(trade, column)
+            if column in self.ARRAY_TRADE_COLUMNS:
+                columns[column][n] = value
+            else:
+                columns[column].append(value)
+        
+        self._trade_count = n + 1
+    
+    def extend_trades(self, trades: pd.DataFrame):
+        """
+        決済済み取引をまとめて記録
+        
+        Args:
+            trades: 取引結果（TRADE_COLUMNSの列を持つDataFrame）
+        """
+        n = self._trade_count
+        required = n + len(trades)
+        columns = self._trade_columns
+        self._reserve_trades(required)
+        
+        for column in self.TRADE_COLUMNS:
+            if column in self.ARRAY_TRADE_COLUMNS:
+                columns[column][n:required] = trades[column].to_numpy(dtype=columns[column].dtype)
+            else:
+                columns[column].extend(trades[column].tolist())
+        
+        self._trade_count = required
+    
+    def trades_frame(self) -> pd.DataFrame:
+        """
+        記録済み取引をDataFrameとして取得
+        
+        Returns:
+            pd.DataFrame: 取引結果
+        """
+        n = self._trade_count
+        return pd.DataFrame({
+            column: values[:n] for column, values in self._trade_columns.items()
+        }, columns=self.TRADE_COLUMNS)
         
     def add_position(self, symbol: str, quantity: int, price: float, 
                     date: datetime, strategy: str, reason: str):
@@ -66,6 +419,7 @@ class Portfolio:
                 'quantity': quantity,
                 'price': price,
                 'entry_date': date,
+                'entry_date_ns': pd.Timestamp(date).value,  # 保有日数計算用の整数時刻
                 'strategy': strategy,
                 'entry_reason': reason
             }
@@ -79,6 +433,7 @@ class Portfolio:
             return None
         
         pos = self.positions[symbol]
+        holding_days = (pd.Timestamp(date).value - pos['entry_date_ns']) // NANOSECONDS_PER_DAY
         if quantity >= pos['quantity']:
             # 全決済
             trade = Trade(
@@ -94,12 +449,12 @@ class Portfolio:
                 exit_reason=reason,
                 profit_loss=(price - pos['price']) * pos['quantity'],
                 profit_loss_pct=(price - pos['price']) / pos['price'],
-                holding_days=(date - pos['entry_date']).days
+                holding_days=holding_days
             )
             
             self.cash += pos['quantity'] * price
             del self.positions[symbol]
-            self.trades.append(trade)
+            self.record_trade(trade)
             return trade
         else:
             # 部分決済
@@ -116,12 +471,12 @@ class Portfolio:
                 exit_reason=reason,
                 profit_loss=(price - pos['price']) * quantity,
                 profit_loss_pct=(price - pos['price']) / pos['price'],
-                holding_days=(date - pos['entry_date']).days
+                holding_days=holding_days
             )
             
             pos['quantity'] -= quantity
             self.cash += quantity * price
-            self.trades.append(trade)
+            self.record_trade(trade)
             return trade
     
     def get_total_value(self, current_prices: Dict[str, float]) -> float:
@@ -135,8 +490,212 @@ class Portfolio:
     def update_equity_curve(self, current_prices: Dict[str, float], date: datetime):
         """エクイティカーブの更新"""
         total_value = self.get_total_value(current_prices)
-        self.equity_curve.append(total_value)
-        self.dates.append(date)
+        self.append_equity(total_value, date)
+
+@dataclass(frozen=True)
+class SingleStockContext:
+    """単一銘柄バックテストの設定（ワーカープロセスへ渡すため軽量な値のみ保持）"""
+    strategy: str
+    entry_codes_fn: Callable[[pd.DataFrame], np.ndarray]
+    exit_codes_fn: Callable[[pd.DataFrame], np.ndarray]
+    strategy_code: int
+    max_holding_days: int
+    vix_block: Optional[pd.Series]
+    total_value: float
+    cash: float
+    risk_per_trade: float
+    max_position_size: float
+
+def _position_size(price: float, risk_amount: float, max_position_value: float,
+                   cash: float) -> int:
+    """
+    ポジションサイズの計算
+    
+    Args:
+        price: エントリー価格
+        risk_amount: 1取引あたりのリスク金額（総資産価値 × リスク割合）
+        max_position_value: 1銘柄あたりの最大ポジション金額（総資産価値 × 最大ポジション割合）
+        cash: 利用可能資金
+    
+    Returns:
+        int: 株数
+    """
+    # リスク・最大ポジション・現金の各上限のうち最小値を採用
+    max_quantity_by_risk = int(risk_amount / price)
+    max_quantity_by_position = int(max_position_value / price)
+    max_quantity_by_cash = int(cash / price)
+    
+    quantity = min(max_quantity_by_risk, max_quantity_by_position, max_quantity_by_cash)
+    
+    return max(0, quantity)
+
+def _indicator_array(data: pd.DataFrame, column: str) -> np.ndarray:
+    """指標列をfloat配列で取得（列がない場合は全てNaNとし、比較は常に偽になる）"""
+    if column in data.columns:
+        return data[column].to_numpy(dtype=float)
+    return np.full(len(data), np.nan)
+
+def _swing_entry_codes(data: pd.DataFrame) -> np.ndarray:
+    """
+    スイングトレード戦略のエントリー条件を全期間分まとめて判定
+    （RSI売られすぎ → MACDゴールデンクロス → 移動平均線ゴールデンクロス）
+    
+    Args:
+        data: 技術指標付きデータ
+    
+    Returns:
+        np.ndarray: 日ごとのエントリー理由コード（SINGLE_STOCK_ENTRY_REASONSの添字、0はエントリーなし）
+    """
+    rsi = _indicator_array(data, 'RSI')
+    macd = _indicator_array(data, 'MACD')
+    macd_signal = _indicator_array(data, 'MACD_Signal')
+    sma_20 = _indicator_array(data, 'SMA_20')
+    sma_50 = _indicator_array(data, 'SMA_50')
+    return np.select(
+        [rsi < 30, macd > macd_signal, sma_20 > sma_50], [1, 2, 3], default=0
+    ).astype(np.int64)
+
+def _long_term_entry_codes(data: pd.DataFrame) -> np.ndarray:
+    """
+    中長期投資戦略のエントリー条件を全期間分まとめて判定
+    （長期上昇トレンド → ボリンジャーバンド下軌道タッチ）
+    
+    Args:
+        data: 技術指標付きデータ
+    
+    Returns:
+        np.ndarray: 日ごとのエントリー理由コード（SINGLE_STOCK_ENTRY_REASONSの添字、0はエントリーなし）
+    """
+    close = _indicator_array(data, 'Close')
+    sma_200 = _indicator_array(data, 'SMA_200')
+    sma_50 = _indicator_array(data, 'SMA_50')
+    bb_lower = _indicator_array(data, 'BB_Lower')
+    return np.select(
+        [sma_200 > sma_50, close <= bb_lower], [4, 5], default=0
+    ).astype(np.int64)
+
+def _swing_exit_codes(data: pd.DataFrame) -> np.ndarray:
+    """
+    スイングトレード戦略の指標によるエグジット条件を全期間分まとめて判定
+    （RSI買われすぎ → MACDデッドクロス）
+    
+    価格変化と保有期間による条件はエントリー価格・日付に依存するため、
+    状態遷移のループ内で判定する。
+    
+    Args:
+        data: 技術指標付きデータ
+    
+    Returns:
+        np.ndarray: 日ごとのエグジット理由コード（SINGLE_STOCK_EXIT_REASONSの添字、0は該当なし）
+    """
+    rsi = _indicator_array(data, 'RSI')
+    macd = _indicator_array(data, 'MACD')
+    macd_signal = _indicator_array(data, 'MACD_Signal')
+    return np.select([rsi > 70, macd < macd_signal], [3, 4], default=0).astype(np.int64)
+
+def _long_term_exit_codes(data: pd.DataFrame) -> np.ndarray:
+    """
+    中長期投資戦略の指標によるエグジット条件を全期間分まとめて判定
+    （長期移動平均線の下降トレンド）
+    
+    Args:
+        data: 技術指標付きデータ
+    
+    Returns:
+        np.ndarray: 日ごとのエグジット理由コード（SINGLE_STOCK_EXIT_REASONSの添字、0は該当なし）
+    """
+    sma_200 = _indicator_array(data, 'SMA_200')
+    sma_50 = _indicator_array(data, 'SMA_50')
+    return np.where(sma_200 < sma_50, 7, 0).astype(np.int64)
+
+def _no_signal_codes(data: pd.DataFrame) -> np.ndarray:
+    """単一銘柄バックテストに対応しない戦略用（全期間でシグナルなし）"""
+    return np.zeros(len(data), dtype=np.int64)
+
+# 戦略ごとの単一銘柄シグナル判定関数（エントリー, エグジット）。戦略の分岐はエンジン生成時に1回だけ行う
+SINGLE_STOCK_SIGNAL_BUILDERS = {
+    "swing_trading": (_swing_entry_codes, _swing_exit_codes),
+    "long_term": (_long_term_entry_codes, _long_term_exit_codes),
+}
+# 状態遷移ループに渡す戦略コードと最大保有日数（未対応の戦略はコード0）
+SINGLE_STOCK_STRATEGY_CODES = {"swing_trading": 1, "long_term": 2}
+SINGLE_STOCK_MAX_HOLDING_DAYS = {"swing_trading": 30, "long_term": 365}
+
+# 単一銘柄バックテストで使う指標計算器（プロセスごとに1つを使い回す）
+_SINGLE_STOCK_INDICATORS = TechnicalIndicators()
+
+def _run_single_stock_backtest(symbol: str, data: pd.DataFrame, start_date: str, end_date: str,
+                               context: SingleStockContext) -> pd.DataFrame:
+    """
+    単一銘柄のバックテスト実行（ワーカープロセスから呼び出せるようモジュール関数として定義）
+    
+    Args:
+        symbol: 銘柄コード
+        data: 株価データ
+        start_date: 開始日
+        end_date: 終了日
+        context: バックテスト設定
+    
+    Returns:
+        pd.DataFrame: 取引結果（Portfolio.TRADE_COLUMNSの列を持つ）
+    """
+    try:
+        # 期間でフィルタリング
+        start_dt = pd.to_datetime(start_date)
+        end_dt = pd.to_datetime(end_date)
+        data = data[(data.index >= start_dt) & (data.index <= end_dt)]
+        
+        if data.empty:
+            return pd.DataFrame(columns=Portfolio.TRADE_COLUMNS)
+        
+        # テクニカル指標の計算（呼び出し元で計算済みの場合は再計算しない）
+        if not _SINGLE_STOCK_INDICATORS.has_all_indicators(data):
+            data = _SINGLE_STOCK_INDICATORS.calculate_all_indicators(data)
+        
+        # 判定に使う列をNumPy配列として一度だけ取り出す（判定関数は戦略ごとに特化済み）
+        strategy = context.strategy
+        close = data['Close'].to_numpy(dtype=float)
+        entry_codes = context.entry_codes_fn(data)
+        exit_codes = context.exit_codes_fn(data)
+        timestamps = data.index.values.astype('datetime64[ns]').view(np.int64)
+        
+        # VIXが30以上の日は取引しない
+        if context.vix_block is not None:
+            entry_codes[context.vix_block.reindex(data.index, fill_value=False).to_numpy(dtype=bool)] = 0
+        
+        # 状態遷移はコンパイル済みのループで実行し、取引の生成のみPythonで行う
+        entry_rows, exit_rows, exit_reasons = _simulate_single_stock(
+            close, timestamps, entry_codes, exit_codes, context.strategy_code, context.max_holding_days
+        )
+        
+        # 取引結果を列単位で生成（株数のみ取引ごとに計算、金額上限は銘柄内で共通）
+        entry_prices = close[entry_rows]
+        exit_prices = close[exit_rows]
+        risk_amount = context.total_value * context.risk_per_trade
+        max_position_value = context.total_value * context.max_position_size
+        quantity = np.array([
+            _position_size(price, risk_amount, max_position_value, context.cash)
+            for price in entry_prices
+        ], dtype=np.int64)
+        
+        return pd.DataFrame({
+            'symbol': symbol,
+            'entry_date': data.index[entry_rows],
+            'exit_date': data.index[exit_rows],
+            'entry_price': entry_prices,
+            'exit_price': exit_prices,
+            'quantity': quantity,
+            'profit_loss': (exit_prices - entry_prices) * quantity,
+            'profit_loss_pct': (exit_prices - entry_prices) / entry_prices,
+            'holding_days': (timestamps[exit_rows] - timestamps[entry_rows]) // NANOSECONDS_PER_DAY,
+            'strategy': strategy,
+            'entry_reason': _ENTRY_REASON_ARRAY[entry_codes[entry_rows]],
+            'exit_reason': _EXIT_REASON_ARRAY[exit_reasons]
+        }, columns=Portfolio.TRADE_COLUMNS)
+        
+    except Exception as e:
+        logging.getLogger(f"{__name__}.{context.strategy}").error(f"単一銘柄バックテストエラー: {symbol}, {e}")
+        return pd.DataFrame(columns=Portfolio.TRADE_COLUMNS)
 
 class BacktestEngine:
     """バックテストエンジン"""
@@ -159,8 +718,14 @@ class BacktestEngine:
         # 戦略固有の設定
         self.max_positions = self.rules["max_positions"]
         self.risk_per_trade = self.rules["risk_per_trade"]
+        self.max_position_size = self.rules.get("max_position_size", 0.25)
         self.max_holding_days = self.rules["max_holding_days"]
         
+        # 単一銘柄バックテストのシグナル判定関数を戦略に応じて束縛
+        self._entry_codes_fn, self._exit_codes_fn = SINGLE_STOCK_SIGNAL_BUILDERS.get(
+            strategy, (_no_signal_codes, _no_signal_codes)
+        )
+        
     def run_backtest(self, symbols: List[str], start_date: str, end_date: str, use_cache_fallback: bool = True) -> Dict:
         """
         バックテスト実行
@@ -214,12 +779,7 @@ class BacktestEngine:
         else:
             self.vix_data = self.data_loader.get_vix_data(start_date, end_date)
         
-        # 日付範囲の取得
-        all_dates = set()
-        for data in all_data.values():
-            all_dates.update(data.index)
-        
-        # バックテスト実行
+        # バックテスト実行（日付範囲は_execute_backtestで統合）
         return self._execute_backtest(all_data, start_date, end_date)
     
     def _get_data_from_cache(self, symbols: List[str], start_date: str, end_date: str) -> Dict[str, pd.DataFrame]:
@@ -235,6 +795,7 @@ class BacktestEngine:
             Dict: 銘柄コードをキーとしたデータ辞書
         """
         all_data = {}
+        valid_symbols = []
         
         for symbol in symbols:
             # 銘柄シンボルが文字列であることを確認
@@ -247,25 +808,24 @@ class BacktestEngine:
                 self.logger.error(f"空の銘柄シンボル: {symbol}")
                 continue
                 
-            symbol = symbol.strip()  # 前後の空白を除去
-            
-            try:
-                data = self.data_loader.get_stock_data_from_cache(
-                    symbol, start_date, end_date, 
-                    interval=self.rules["timeframe"]
-                )
-                if not data.empty:
-                    data = self.data_loader.clean_data(data)
-                    if self.data_loader.validate_data(data):
-                        data = self.indicators.calculate_all_indicators(data)
-                        all_data[symbol] = data
-                        self.logger.info(f"キャッシュからデータ取得成功: {symbol}")
-                    else:
-                        self.logger.warning(f"データ検証失敗: {symbol}")
-                else:
-                    self.logger.warning(f"空のデータ: {symbol}")
-            except (FileNotFoundError, ValueError) as e:
+            valid_symbols.append(symbol.strip())  # 前後の空白を除去
+        
+        # 指標計算の間に後続銘柄のファイル読み込みを先行させる
+        for symbol, data in self.data_loader.iter_stock_data_from_cache(
+            valid_symbols, start_date, end_date, interval=self.rules["timeframe"]
+        ):
+            if data is None:
                 self.logger.warning(f"キャッシュからデータ取得失敗: {symbol}")
+            elif not data.empty:
+                data = self.data_loader.clean_data(data)
+                if self.data_loader.validate_data(data):
+                    data = self.indicators.calculate_all_indicators(data)
+                    all_data[symbol] = data
+                    self.logger.info(f"キャッシュからデータ取得成功: {symbol}")
+                else:
+                    self.logger.warning(f"データ検証失敗: {symbol}")
+            else:
+                self.logger.warning(f"空のデータ: {symbol}")
         
         return all_data
     
@@ -309,15 +869,31 @@ class BacktestEngine:
             Dict: バックテスト結果
         """
         # 日付範囲の取得
-        all_dates = set()
-        for data in all_data.values():
-            all_dates.update(data.index)
+        all_dates = self._union_dates(data.index for data in all_data.values())
+        
+        # 終値を (日付数, 銘柄数) の行列に整列（データのない日はNaN・available=False）
+        # エントリー条件も銘柄ごとに1回だけ評価して同じ形の行列に整列
+        symbols = list(all_data.keys())
+        close_matrix = np.full((len(all_dates), len(symbols)), np.nan)
+        available = np.zeros((len(all_dates), len(symbols)), dtype=bool)
+        entry_matrix = np.zeros((len(all_dates), len(symbols)), dtype=bool)
+        for j, data in enumerate(all_data.values()):
+            rows = all_dates.get_indexer(data.index)
+            close_matrix[rows, j] = data['Close'].to_numpy(dtype=float)
+            available[rows, j] = True
+            entry_matrix[rows, j] = self.indicators.check_entry_conditions(data, self.strategy).to_numpy(dtype=bool)
+        
+        # エグジット判定に使う各銘柄の最終行は期間中不変のため、辞書として1回だけ取り出す
+        latest_rows = {
+            symbol: data.iloc[-1].to_dict() for symbol, data in all_data.items() if not data.empty
+        }
         
-        all_dates = sorted(list(all_dates))
+        # 日次のエクイティ点数は日付数で確定するため、ループ前に配列を確保
+        self.portfolio.reserve_equity(len(all_dates))
         
         # バックテスト実行
-        for date in all_dates:
-            self._process_date(date, all_data)
+        for row, date in enumerate(all_dates):
+            self._process_date(date, latest_rows, symbols, close_matrix[row], available[row], entry_matrix[row])
         
         # 結果計算
         results = self._calculate_results()
@@ -327,7 +903,7 @@ class BacktestEngine:
     
     def run_backtest_parallel(self, stocks_data: Dict[str, pd.DataFrame], 
                              start_date: str, end_date: str, 
-                             max_workers: int = 3) -> Dict:
+                             max_workers: Optional[int] = None) -> Dict:
         """
         並列処理によるバックテスト実行（高速化版）
         
@@ -335,7 +911,7 @@ class BacktestEngine:
             stocks_data: 銘柄コードをキーとしたデータ辞書
             start_date: 開始日
             end_date: 終了日
-            max_workers: 並列処理の最大ワーカー数
+            max_workers: 並列処理の最大ワーカー数（Noneの場合はCPUコア数）
         
         Returns:
             Dict: バックテスト結果
@@ -358,12 +934,20 @@ class BacktestEngine:
         self.logger.info(f"有効なデータ: {len(processed_data)}銘柄")
         
         # 並列処理でバックテスト実行
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # 指標が計算済みでnumbaが使える場合、処理の大半はGILを解放するカーネルとNumPy演算のため
+        # スレッドで並列化してデータのプロセス間転送を省略し、それ以外はプロセスで並列化
+        use_threads = NUMBA_AVAILABLE and all(
+            self.indicators.has_all_indicators(data) for data in processed_data.values()
+        )
+        executor_class = (concurrent.futures.ThreadPoolExecutor if use_threads
+                          else concurrent.futures.ProcessPoolExecutor)
+        with executor_class(max_workers=max_workers) as executor:
             # 部分関数を作成
             backtest_func = partial(
-                self._run_single_stock_backtest,
+                _run_single_stock_backtest,
                 start_date=start_date,
-                end_date=end_date
+                end_date=end_date,
+                context=self._single_stock_context()
             )
             
             # 並列実行
@@ -381,8 +965,8 @@ class BacktestEngine:
                 
                 try:
                     trades = future.result()
-                    if trades:
-                        all_trades.extend(trades)
+                    if not trades.empty:
+                        all_trades.append(trades)
                     
                     # 進捗表示
                     if completed % 10 == 0 or completed == len(processed_data):
@@ -396,12 +980,10 @@ class BacktestEngine:
             # ポートフォリオを再構築
             self.portfolio = Portfolio()
             
-            # 取引を日付順にソート
-            all_trades.sort(key=lambda x: x.entry_date)
-            
-            # 取引を適用
-            for trade in all_trades:
-                self.portfolio.trades.append(trade)
+            # 取引を日付順にソートしてまとめて記録
+            trades = pd.concat(all_trades, ignore_index=True)
+            trades = trades.sort_values('entry_date', kind='stable', ignore_index=True)
+            self.portfolio.extend_trades(trades)
             
             # エクイティカーブを再構築
             self._reconstruct_equity_curve(processed_data, start_date, end_date)
@@ -427,327 +1009,240 @@ class BacktestEngine:
             end_date: 終了日
         """
         try:
-            # 全取引を日付順にソート
-            all_trades = sorted(self.portfolio.trades, key=lambda x: x.entry_date)
-            
             # 期間内の全日付を取得
             start_dt = pd.to_datetime(start_date)
             end_dt = pd.to_datetime(end_date)
             
-            # 全銘柄の日付を統合
-            all_dates = set()
-            for data in stocks_data.values():
-                if not data.empty:
-                    period_data = data[(data.index >= start_dt) & (data.index <= end_dt)]
-                    all_dates.update(period_data.index)
-            
-            all_dates = sorted(list(all_dates))
+            # 全銘柄の日付を統合して期間内に絞り込み
+            all_dates = self._union_dates(data.index for data in stocks_data.values() if not data.empty)
+            all_dates = all_dates[(all_dates >= start_dt) & (all_dates <= end_dt)]
             
             # ポートフォリオの初期化
-            self.portfolio.equity_curve = [self.portfolio.initial_capital]
-            self.portfolio.dates = [all_dates[0] if all_dates else start_dt]
+            self.portfolio.reset_equity_curve(
+                self.portfolio.initial_capital, all_dates[0] if len(all_dates) else start_dt
+            )
             
-            # 各日付でエクイティを計算
-            current_cash = self.portfolio.initial_capital
-            current_positions = {}  # {symbol: {'quantity': int, 'entry_price': float}}
+            # 終値を (日付数, 銘柄数) の行列に整列（その日のデータがない銘柄は評価対象外）
+            symbols = [symbol for symbol, data in stocks_data.items() if not data.empty]
+            symbol_index = {symbol: j for j, symbol in enumerate(symbols)}
+            close_matrix = np.zeros((len(all_dates), len(symbols)))
+            available = np.zeros((len(all_dates), len(symbols)), dtype=bool)
+            for j, symbol in enumerate(symbols):
+                data = stocks_data[symbol]
+                rows = all_dates.get_indexer(data.index)
+                in_period = rows >= 0
+                close_matrix[rows[in_period], j] = data['Close'].to_numpy(dtype=float)[in_period]
+                available[rows[in_period], j] = True
             
-            for date in all_dates:
-                # その日の取引を処理（エントリーとエグジット両方）
-                entry_trades = [t for t in all_trades if t.entry_date.date() == date.date()]
-                exit_trades = [t for t in all_trades if t.exit_date and t.exit_date.date() == date.date()]
-                
-                # エグジット取引の処理（先に処理）
-                for trade in exit_trades:
-                    if trade.symbol in current_positions:
-                        pos = current_positions[trade.symbol]
-                        if pos['quantity'] >= trade.quantity:
-                            # 決済処理
-                            current_cash += trade.quantity * trade.exit_price
-                            pos['quantity'] -= trade.quantity
-                            if pos['quantity'] <= 0:
-                                del current_positions[trade.symbol]
-                
-                # エントリー取引の処理
-                for trade in entry_trades:
-                    # ポジション追加
-                    if trade.symbol not in current_positions:
-                        current_positions[trade.symbol] = {
-                            'quantity': trade.quantity,
-                            'entry_price': trade.entry_price
-                        }
-                        current_cash -= trade.quantity * trade.entry_price
-                    else:
-                        # 既存ポジションの更新
-                        pos = current_positions[trade.symbol]
-                        pos['quantity'] += trade.quantity
-                        current_cash -= trade.quantity * trade.entry_price
-                
-                # 現在価格での総資産価値を計算
-                total_value = current_cash
-                for symbol, pos in current_positions.items():
-                    if symbol in stocks_data and not stocks_data[symbol].empty:
-                        if date in stocks_data[symbol].index:
-                            current_price = stocks_data[symbol].loc[date, 'Close']
-                            total_value += pos['quantity'] * current_price
-                
-                # エクイティカーブに追加
-                self.portfolio.equity_curve.append(total_value)
-                self.portfolio.dates.append(date)
+            # 取引日を日付行に対応付け（期間外の取引は対象外、エントリーのない決済も対象外）
+            trades = self.portfolio.trades_frame()
+            trades = trades[trades['symbol'].isin(symbol_index)]
+            days = all_dates.normalize()
+            entry_rows = self._day_rows(days, trades['entry_date'])
+            exit_rows = self._day_rows(days, trades['exit_date'])
+            columns = trades['symbol'].map(symbol_index).to_numpy(dtype=np.int64)
+            quantity = trades['quantity'].to_numpy(dtype=float)
+            entered = entry_rows >= 0
+            exited = entered & (exit_rows >= 0)
+            
+            # 日次のキャッシュフローと保有株数の増減を日付行ごとに集計して累積
+            # （エントリー→決済の順に連結し、bincountの重み付き集計で1回で合算）
+            n_dates, n_symbols = len(all_dates), len(symbols)
+            flow_rows = np.concatenate([entry_rows[entered], exit_rows[exited]])
+            flow_columns = np.concatenate([columns[entered], columns[exited]])
+            share_flow = np.concatenate([quantity[entered], -quantity[exited]])
+            flow_prices = np.concatenate([
+                trades['entry_price'].to_numpy(dtype=float)[entered],
+                trades['exit_price'].to_numpy(dtype=float)[exited]
+            ])
+            cash_flow = np.bincount(flow_rows, weights=-share_flow * flow_prices, minlength=n_dates)
+            cash = self.portfolio.initial_capital + np.cumsum(cash_flow)
+            
+            position_changes = np.bincount(
+                flow_rows * n_symbols + flow_columns, minlength=n_dates * n_symbols, weights=share_flow
+            ).reshape(n_dates, n_symbols)
+            positions = np.cumsum(position_changes, axis=0)
+            
+            # 総資産価値 = 現金 + 保有株数 × 終値（保有中かつデータのある銘柄のみ）
+            held = (positions != 0) & available
+            total_values = cash + np.where(held, positions * close_matrix, 0.0).sum(axis=1)
+            
+            # エクイティカーブに追加
+            self.portfolio.extend_equity(total_values, all_dates)
             
             self.logger.info(f"エクイティカーブ再構築完了: {len(self.portfolio.equity_curve)}ポイント")
             
         except Exception as e:
             self.logger.error(f"エクイティカーブ再構築エラー: {e}")
             # フォールバック: 初期資本のみ
-            self.portfolio.equity_curve = [self.portfolio.initial_capital]
-            self.portfolio.dates = [pd.to_datetime(start_date)]
+            self.portfolio.reset_equity_curve(self.portfolio.initial_capital, pd.to_datetime(start_date))
     
-    def _run_single_stock_backtest(self, symbol: str, data: pd.DataFrame, 
-                                  start_date: str, end_date: str) -> List[Trade]:
+    @staticmethod
+    def _union_dates(indexes) -> pd.DatetimeIndex:
         """
-        単一銘柄のバックテスト実行
+        複数銘柄の日付インデックスを統合（連結→重複除去→ソートを一括で実行）
         
         Args:
-            symbol: 銘柄コード
-            data: 株価データ
-            start_date: 開始日
-            end_date: 終了日
+            indexes: 銘柄ごとの日付インデックス
         
         Returns:
-            List[Trade]: 取引リスト
+            pd.DatetimeIndex: 昇順の重複のない日付
         """
-        try:
-            # 期間でフィルタリング
-            start_dt = pd.to_datetime(start_date)
-            end_dt = pd.to_datetime(end_date)
-            data = data[(data.index >= start_dt) & (data.index <= end_dt)]
-            
-            if data.empty:
-                return []
-            
-            # テクニカル指標の計算
-            indicators = TechnicalIndicators()
-            data = indicators.calculate_all_indicators(data)
-            
-            # 取引シグナルの生成
-            trades = []
-            position = None
-            
-            for date, row in data.iterrows():
-                # エントリー条件のチェック
-                if position is None:
-                    # 単一銘柄用のエントリー条件チェック
-                    entry_signal = self._check_single_stock_entry_conditions(row, symbol)
-                    if entry_signal:
-                        position = {
-                            'symbol': symbol,
-                            'entry_date': date,
-                            'entry_price': row['Close'],
-                            'quantity': self._calculate_position_size(symbol, row['Close']),
-                            'entry_reason': entry_signal
-                        }
-                
-                # エグジット条件のチェック
-                elif position:
-                    exit_signal = self._check_single_stock_exit_conditions(row, position, date)
-                    if exit_signal:
-                        trade = Trade(
-                            symbol=position['symbol'],
-                            entry_date=position['entry_date'],
-                            exit_date=date,
-                            entry_price=position['entry_price'],
-                            exit_price=row['Close'],
-                            quantity=position['quantity'],
-                            trade_type=TradeType.SELL,
-                            strategy=self.strategy,
-                            entry_reason=position['entry_reason'],
-                            exit_reason=exit_signal,
-                            profit_loss=(row['Close'] - position['entry_price']) * position['quantity'],
-                            profit_loss_pct=(row['Close'] - position['entry_price']) / position['entry_price'],
-                            holding_days=(date - position['entry_date']).days
-                        )
-                        trades.append(trade)
-                        position = None
-            
-            return trades
-            
-        except Exception as e:
-            self.logger.error(f"単一銘柄バックテストエラー: {symbol}, {e}")
-            return []
+        indexes = list(indexes)
+        if not indexes:
+            return pd.DatetimeIndex([])
+        
+        return pd.DatetimeIndex(indexes[0].append(indexes[1:]).unique()).sort_values()
     
-    def _check_single_stock_entry_conditions(self, row: pd.Series, symbol: str) -> Optional[str]:
+    @staticmethod
+    def _day_rows(days: pd.DatetimeIndex, dates: pd.Series) -> np.ndarray:
         """
-        単一銘柄のエントリー条件チェック
+        日時を日付単位で照合し、対応する日付行の位置を取得
         
         Args:
-            row: 現在のデータ行
-            symbol: 銘柄コード
+            days: 日付（昇順、時刻は切り捨て済み）
+            dates: 照合する日時
         
         Returns:
-            Optional[str]: エントリー理由
+            np.ndarray: 日付の最初の行位置（該当する日付がない場合は-1）
         """
-        try:
-            # VIXが30以上の場合、取引しない
-            if hasattr(self, 'vix_data') and not self.vix_data.empty:
-                current_date = row.name
-                if current_date in self.vix_data.index:
-                    vix_value = self.vix_data.loc[current_date, 'Close']
-                    if vix_value >= 30:
-                        return None  # VIXが高いため取引しない
-            
-            # スイングトレード戦略
-            if self.strategy == "swing_trading":
-                # RSIが30以下で買われすぎ
-                if 'RSI' in row and row['RSI'] < 30:
-                    return "RSI_oversold"
-                
-                # MACDがゴールデンクロス
-                if 'MACD' in row and 'MACD_Signal' in row and row['MACD'] > row['MACD_Signal']:
-                    return "MACD_golden_cross"
-                
-                # 移動平均線のゴールデンクロス
-                if 'SMA_20' in row and 'SMA_50' in row and row['SMA_20'] > row['SMA_50']:
-                    return "SMA_golden_cross"
-            
-            # 中長期投資戦略
-            elif self.strategy == "long_term":
-                # 長期移動平均線の上昇トレンド
-                if 'SMA_200' in row and 'SMA_50' in row and row['SMA_200'] > row['SMA_50']:
-                    return "long_term_uptrend"
-                
-                # ボリンジャーバンドの下軌道タッチ
-                if 'BB_Lower' in row and row['Close'] <= row['BB_Lower']:
-                    return "bollinger_oversold"
-            
-            return None
-            
-        except Exception as e:
-            self.logger.error(f"エントリー条件チェックエラー: {symbol}, {e}")
-            return None
+        targets = pd.DatetimeIndex(dates).normalize()
+        rows = np.searchsorted(days.values, targets.values)
+        found = rows < len(days)
+        found[found] = days.values[rows[found]] == targets.values[found]
+        return np.where(found, rows, -1)
     
-    def _check_single_stock_exit_conditions(self, row: pd.Series, position: dict, date: datetime) -> Optional[str]:
+    def _run_single_stock_backtest(self, symbol: str, data: pd.DataFrame, 
+                                  start_date: str, end_date: str) -> List[Trade]:
         """
-        単一銘柄のエグジット条件チェック
+        単一銘柄のバックテスト実行
         
         Args:
-            row: 現在のデータ行
-            position: ポジション情報
-            date: 現在の日付
+            symbol: 銘柄コード
+            data: 株価データ
+            start_date: 開始日
+            end_date: 終了日
         
         Returns:
-            Optional[str]: エグジット理由
+            List[Trade]: 取引リスト
         """
-        try:
-            entry_price = position['entry_price']
-            current_price = row['Close']
-            
-            # 利益確定（10%以上）
-            if current_price >= entry_price * 1.10:
-                return "profit_taking"
-            
-            # 損切り（-5%以下）
-            if current_price <= entry_price * 0.95:
-                return "stop_loss"
-            
-            # スイングトレード戦略
-            if self.strategy == "swing_trading":
-                # RSIが70以上で売られすぎ
-                if 'RSI' in row and row['RSI'] > 70:
-                    return "RSI_overbought"
-                
-                # MACDがデッドクロス
-                if 'MACD' in row and 'MACD_Signal' in row and row['MACD'] < row['MACD_Signal']:
-                    return "MACD_dead_cross"
-                
-                # 保有期間が30日を超える
-                holding_days = (date - position['entry_date']).days
-                if holding_days > 30:
-                    return "time_exit"
-            
-            # 中長期投資戦略
-            elif self.strategy == "long_term":
-                # 保有期間が1年を超える
-                holding_days = (date - position['entry_date']).days
-                if holding_days > 365:
-                    return "long_term_exit"
-                
-                # 長期移動平均線の下降トレンド
-                if 'SMA_200' in row and 'SMA_50' in row and row['SMA_200'] < row['SMA_50']:
-                    return "trend_reversal"
-            
-            return None
-            
-        except Exception as e:
-            self.logger.error(f"エグジット条件チェックエラー: {position['symbol']}, {e}")
-            return None
+        trades = _run_single_stock_backtest(symbol, data, start_date, end_date, self._single_stock_context())
+        return _trades_from_frame(trades)
     
-    def _process_date(self, date: datetime, all_data: Dict[str, pd.DataFrame]):
-        """特定日の処理"""
-        current_prices = {}
+    def _single_stock_context(self) -> "SingleStockContext":
+        """単一銘柄バックテスト用の設定を作成（プロセス間で受け渡し可能な値のみ）"""
+        # VIXの閾値判定は銘柄ごとに繰り返さず、ここで1回だけマスク化する
+        vix_block = None
+        if hasattr(self, 'vix_data') and not self.vix_data.empty:
+            vix_block = self.vix_data['Close'] >= 30
+        
+        return SingleStockContext(
+            strategy=self.strategy,
+            entry_codes_fn=self._entry_codes_fn,
+            exit_codes_fn=self._exit_codes_fn,
+            strategy_code=SINGLE_STOCK_STRATEGY_CODES.get(self.strategy, 0),
+            max_holding_days=SINGLE_STOCK_MAX_HOLDING_DAYS.get(self.strategy, 0),
+            vix_block=vix_block,
+            # 銘柄ごとに未保有のポートフォリオを基準としてサイズを計算
+            total_value=self.portfolio.get_total_value({}),
+            cash=self.portfolio.cash,
+            risk_per_trade=self.risk_per_trade,
+            max_position_size=self.max_position_size
+        )
+    
+    def _process_date(self, date: datetime, latest_rows: Dict[str, Dict],
+                      symbols: List[str], close_row: np.ndarray, available_row: np.ndarray,
+                      entry_row: np.ndarray):
+        """
+        特定日の処理
         
-        # 現在価格の取得
-        for symbol, data in all_data.items():
-            if date in data.index:
-                current_prices[symbol] = data.loc[date, 'Close']
+        Args:
+            date: 処理日
+            latest_rows: 銘柄ごとのエグジット判定用の行
+            symbols: 銘柄リスト（終値行列の列順）
+            close_row: 処理日の終値（終値行列の1行）
+            available_row: 処理日にデータが存在する銘柄のマスク
+            entry_row: 処理日にエントリー条件を満たす銘柄のマスク
+        """
+        # 現在価格の取得（処理日にデータがある銘柄のみ）
+        current_prices = {
+            symbols[j]: close_row[j] for j in np.flatnonzero(available_row)
+        }
         
         # エグジット条件のチェック
-        self._check_exit_conditions(date, all_data, current_prices)
+        self._check_exit_conditions(date, latest_rows, current_prices)
+        
+        # 決済後の総資産価値（同日のエントリーは現金と保有評価額の振替のため不変）
+        total_value = self.portfolio.get_total_value(current_prices)
         
         # エントリー条件のチェック
-        self._check_entry_conditions(date, all_data, current_prices)
+        self._check_entry_conditions(date, symbols, close_row, total_value, entry_row)
         
-        # エクイティカーブの更新
-        self.portfolio.update_equity_curve(current_prices, date)
+        # エクイティカーブの更新（エントリー後も総資産価値は不変のため再計算しない）
+        self.portfolio.append_equity(total_value, date)
     
-    def _check_entry_conditions(self, date: datetime, all_data: Dict[str, pd.DataFrame], 
-                              current_prices: Dict[str, float]):
-        """エントリー条件のチェック"""
+    def _check_entry_conditions(self, date: datetime, symbols: List[str], close_row: np.ndarray,
+                              total_value: float, entry_row: np.ndarray):
+        """
+        エントリー条件のチェック
+        
+        Args:
+            date: 処理日
+            symbols: 銘柄リスト（終値行列の列順）
+            close_row: 処理日の終値（終値行列の1行）
+            total_value: 処理日の総資産価値
+            entry_row: 処理日にエントリー条件を満たす銘柄のマスク（データのない銘柄はFalse）
+        """
         # 最大ポジション数のチェック
         if len(self.portfolio.positions) >= self.max_positions:
             return
         
-        for symbol, data in all_data.items():
+        # 総資産価値に基づく金額上限は同日の全候補で共通のため1回だけ計算
+        risk_amount = total_value * self.risk_per_trade
+        max_position_value = total_value * self.max_position_size
+        
+        # エントリー条件を満たす銘柄の列位置のみを走査（事前計算済み）
+        for j in np.flatnonzero(entry_row):
+            symbol = symbols[j]
             if symbol in self.portfolio.positions:
                 continue  # 既にポジション保有
             
-            if date not in data.index:
-                continue
+            price = close_row[j]
             
-            # エントリー条件の確認
-            entry_conditions = self.indicators.check_entry_conditions(data, self.strategy)
+            # ポジションサイズの計算
+            position_size = self._calculate_position_size(symbol, price, risk_amount, max_position_value)
             
-            if entry_conditions.loc[date]:
-                # ポジションサイズの計算
-                position_size = self._calculate_position_size(symbol, current_prices[symbol])
-                
-                if position_size > 0:
-                    self.portfolio.add_position(
-                        symbol=symbol,
-                        quantity=position_size,
-                        price=current_prices[symbol],
-                        date=date,
-                        strategy=self.strategy,
-                        reason="entry_conditions_met"
-                    )
-                    self.logger.info(f"エントリー: {symbol} at {current_prices[symbol]:.2f}")
+            if position_size > 0:
+                self.portfolio.add_position(
+                    symbol=symbol,
+                    quantity=position_size,
+                    price=price,
+                    date=date,
+                    strategy=self.strategy,
+                    reason="entry_conditions_met"
+                )
+                self.logger.info(f"エントリー: {symbol} at {price:.2f}")
     
-    def _check_exit_conditions(self, date: datetime, all_data: Dict[str, pd.DataFrame], 
+    def _check_exit_conditions(self, date: datetime, latest_rows: Dict[str, Dict], 
                              current_prices: Dict[str, float]):
         """エグジット条件のチェック"""
+        # 保有日数は整数時刻の差で計算（Timedeltaを銘柄ごとに生成しない）
+        date_ns = pd.Timestamp(date).value
+        
         for symbol in list(self.portfolio.positions.keys()):
-            if symbol not in all_data or date not in all_data[symbol].index:
+            if symbol not in latest_rows or symbol not in current_prices:
                 continue
             
             pos = self.portfolio.positions[symbol]
             current_price = current_prices[symbol]
             
-            # エグジット条件の確認
-            exit_conditions = self.indicators.check_exit_conditions(
-                all_data[symbol], self.strategy, pos['price'], current_price
+            # エグジット条件の確認（銘柄データの最終行で判定）
+            exit_conditions = self.indicators.check_exit_conditions_for_row(
+                latest_rows[symbol], self.strategy, pos['price'], current_price
             )
             
             # 保有期間のチェック
-            holding_days = (date - pos['entry_date']).days
+            holding_days = (date_ns - pos['entry_date_ns']) // NANOSECONDS_PER_DAY
             if holding_days >= self.max_holding_days:
                 exit_conditions["exit"] = True
                 exit_conditions["reason"] = "max_holding_days"
@@ -776,70 +1271,39 @@ class BacktestEngine:
                     )
                     self.logger.info(f"部分決済: {symbol} {partial_quantity}株 at {current_price:.2f}")
     
-    def _calculate_position_size(self, symbol: str, price: float) -> int:
-        """ポジションサイズの計算"""
-        # リスクベースのポジションサイズ計算
-        risk_amount = self.portfolio.get_total_value({}) * self.risk_per_trade
-        
-        # 最大ポジションサイズのチェック
-        max_position_value = self.portfolio.get_total_value({}) * self.rules.get("max_position_size", 0.25)
-        
-        # 利用可能資金のチェック
-        available_cash = self.portfolio.cash
-        
-        # 最小値を採用
-        max_quantity_by_risk = int(risk_amount / price)
-        max_quantity_by_position = int(max_position_value / price)
-        max_quantity_by_cash = int(available_cash / price)
+    def _calculate_position_size(self, symbol: str, price: float, risk_amount: float,
+                                 max_position_value: float) -> int:
+        """
+        ポジションサイズの計算
         
-        quantity = min(max_quantity_by_risk, max_quantity_by_position, max_quantity_by_cash)
+        Args:
+            symbol: 銘柄コード
+            price: エントリー価格
+            risk_amount: 1取引あたりのリスク金額
+            max_position_value: 1銘柄あたりの最大ポジション金額
         
-        return max(0, quantity)
+        Returns:
+            int: 株数
+        """
+        # 現金はエントリーごとに減るため、候補ごとに最新の値を使う
+        return _position_size(price, risk_amount, max_position_value, self.portfolio.cash)
     
     def _calculate_results(self) -> Dict:
         """バックテスト結果の計算"""
-        if not self.portfolio.trades:
+        if self.portfolio.trade_count == 0:
             return {"error": "取引がありません"}
         
-        trades_df = pd.DataFrame([
-            {
-                'symbol': t.symbol,
-                'entry_date': t.entry_date,
-                'exit_date': t.exit_date,
-                'entry_price': t.entry_price,
-                'exit_price': t.exit_price,
-                'quantity': t.quantity,
-                'profit_loss': t.profit_loss,
-                'profit_loss_pct': t.profit_loss_pct,
-                'holding_days': t.holding_days,
-                'strategy': t.strategy,
-                'entry_reason': t.entry_reason,
-                'exit_reason': t.exit_reason
-            }
-            for t in self.portfolio.trades
-        ])
+        trades_df = self.portfolio.trades_frame()
         
         # 基本統計
         total_return = (self.portfolio.equity_curve[-1] - self.portfolio.initial_capital) / self.portfolio.initial_capital
         total_trades = len(trades_df)
-        winning_trades = len(trades_df[trades_df['profit_loss'] > 0])
-        losing_trades = len(trades_df[trades_df['profit_loss'] < 0])
+        equity = self.portfolio.equity_curve
+        max_drawdown, sharpe_ratio, winning_trades, losing_trades, avg_profit, avg_loss = _performance_stats(
+            equity, trades_df['profit_loss'].to_numpy(dtype=np.float64)
+        )
         win_rate = winning_trades / total_trades if total_trades > 0 else 0
         
-        # 平均利益・損失
-        avg_profit = trades_df[trades_df['profit_loss'] > 0]['profit_loss'].mean() if winning_trades > 0 else 0
-        avg_loss = trades_df[trades_df['profit_loss'] < 0]['profit_loss'].mean() if losing_trades > 0 else 0
-        
-        # 最大ドローダウン
-        equity_series = pd.Series(self.portfolio.equity_curve, index=self.portfolio.dates)
-        rolling_max = equity_series.expanding().max()
-        drawdown = (equity_series - rolling_max) / rolling_max
-        max_drawdown = drawdown.min()
-        
-        # シャープレシオ
-        returns = equity_series.pct_change().dropna()
-        sharpe_ratio = returns.mean() / returns.std() * np.sqrt(252) if returns.std() > 0 else 0
-        
         results = {
             "strategy": self.strategy,
             "total_return": total_return,
@@ -853,10 +1317,10 @@ class BacktestEngine:
             "sharpe_ratio": sharpe_ratio,
             "final_equity": self.portfolio.equity_curve[-1],
             "initial_capital": self.portfolio.initial_capital,
-            "trades": trades_df.to_dict('records'),
+            "trades": _records_from_frame(trades_df),
             "equity_curve": {
-                "dates": [d.strftime("%Y-%m-%d") for d in self.portfolio.dates],
-                "values": self.portfolio.equity_curve
+                "dates": np.datetime_as_string(self.portfolio.dates, unit='D').tolist(),
+                "values": equity.copy()  # JSON化は保存時に行う（orjsonはndarrayを直接シリアライズ）
             },
             "vix_data": self._prepare_vix_data(self.vix_data) if not self.vix_data.empty else {}
         }
@@ -877,25 +1341,21 @@ class BacktestEngine:
             return {}
         
         # 日付とVIX値を抽出
-        vix_dates = [d.strftime("%Y-%m-%d") for d in vix_data.index]
+        vix_dates = vix_data.index.strftime("%Y-%m-%d").tolist()
         vix_values = vix_data['Close'].tolist()
         
         # VIX統計を計算
         vix_stats = {
-            "min": float(vix_data['Close'].min()),
-            "max": float(vix_data['Close'].max()),
-            "mean": float(vix_data['Close'].mean()),
-            "std": float(vix_data['Close'].std())
+            name: float(value)
+            for name, value in vix_data['Close'].agg(['min', 'max', 'mean', 'std']).items()
         }
         
-        # 高ボラティリティ期間を特定
-        high_vol_periods = []
-        for i, (date, value) in enumerate(zip(vix_dates, vix_values)):
-            if value > 30:  # VIX > 30を高ボラティリティとする
-                high_vol_periods.append({
-                    "date": date,
-                    "vix": value
-                })
+        # 高ボラティリティ期間を特定（VIX > 30を高ボラティリティとする）
+        high_vol = vix_data.loc[vix_data['Close'] > 30, 'Close']
+        high_vol_periods = [
+            {"date": date, "vix": value}
+            for date, value in zip(high_vol.index.strftime("%Y-%m-%d"), high_vol.tolist())
+        ]
         
         return {
             "dates": vix_dates,
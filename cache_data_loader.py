@@ -4,27 +4,271 @@
 """
 
 import os
+import re
 import pandas as pd
-import pickle
+import numpy as np
 import logging
-from typing import List, Optional, Dict
+import functools
+import itertools
+import threading
+import concurrent.futures
+from collections import deque
+from datetime import date
+from typing import List, Optional, Dict, Tuple, Iterator
+
+from config import MAX_WORKERS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# pickleと同名で置く列指向形式のキャッシュ（先頭ほど優先）
+COLUMNAR_EXTENSIONS = (".arrow", ".parquet")
+
+# キャッシュファイル名の形式: {symbol}_{interval}_{start_date}_{end_date}.pkl（銘柄コードは"_"を含んでもよい）
+CACHE_FILE_PATTERN = re.compile(
+    r"(?P<symbol>.+)_(?P<interval>[^_]+)_(?P<start>\d{4}-\d{2}-\d{2})_(?P<end>\d{4}-\d{2}-\d{2})\.pkl"
+)
+
+# プロセス内で保持するマスタデータの最大件数
+MASTER_CACHE_SIZE = 512
+
+# 株価データに必須の列（validate_dataで存在と欠損を確認）
+REQUIRED_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+REQUIRED_COLUMN_SET = frozenset(REQUIRED_COLUMNS)
+
+@functools.lru_cache(maxsize=MASTER_CACHE_SIZE)
+def _load_pickle_master(path: str, mtime_ns: int) -> pd.DataFrame:
+    """
+    pickleのマスタデータを読み込み（プロセス内でキャッシュ）
+    
+    Args:
+        path: マスタデータファイルのパス
+        mtime_ns: ファイルの更新時刻（キーに含め、更新されたファイルは読み直す）
+    
+    Returns:
+        DataFrame: マスタデータ（キャッシュと共有されるため変更しないこと）
+    """
+    # ファイルから直接読み込む（pickleはフレーム単位で読むため全体のコピーは発生しない。
+    # mmapを渡すと1バイト単位の読み出しになり、遅く使用メモリも増える）
+    # read_pickleは拡張子から圧縮形式を判定し、旧バージョンのpandasで書かれたpickleにも対応する
+    return pd.read_pickle(path)
+
+@functools.lru_cache(maxsize=MASTER_CACHE_SIZE)
+def _load_parquet_range(path: str, mtime_ns: int, start_date: str, end_date: str) -> pd.DataFrame:
+    """
+    Parquetのマスタデータから要求期間の行グループのみを読み込み（プロセス内でキャッシュ）
+    
+    Args:
+        path: Parquetファイルのパス
+        mtime_ns: ファイルの更新時刻（キーに含め、更新されたファイルは読み直す）
+        start_date: 開始日
+        end_date: 終了日
+    
+    Returns:
+        DataFrame: 要求期間のデータ（キャッシュと共有されるため変更しないこと）
+    """
+    index_column = pq.read_schema(path).pandas_metadata['index_columns'][0]
+    return pd.read_parquet(path, filters=[
+        (index_column, '>=', pd.Timestamp(start_date)),
+        (index_column, '<', pd.Timestamp(end_date) + pd.Timedelta(days=1))
+    ])
+
+@functools.lru_cache(maxsize=MASTER_CACHE_SIZE)
+def _load_arrow_range(path: str, mtime_ns: int, start_date: str, end_date: str) -> pd.DataFrame:
+    """
+    Arrow IPCのマスタデータから要求期間のみを読み込み（プロセス内でキャッシュ）
+    
+    ファイルをメモリマップし、日付順の索引列を二分探索して要求期間の行だけを
+    コピーせずに切り出してからDataFrameに変換する。
+    
+    Args:
+        path: Arrow IPCファイルのパス
+        mtime_ns: ファイルの更新時刻（キーに含め、更新されたファイルは読み直す）
+        start_date: 開始日
+        end_date: 終了日
+    
+    Returns:
+        DataFrame: 要求期間のデータ（キャッシュと共有されるため変更しないこと）
+    """
+    with pa.memory_map(path) as source:
+        table = pa.ipc.open_file(source).read_all()
+        index_column = table.schema.pandas_metadata['index_columns'][0]
+        dates = pd.DatetimeIndex(table.column(index_column).to_numpy())
+        start = dates.searchsorted(pd.Timestamp(start_date), side='left')
+        end = dates.searchsorted(pd.Timestamp(end_date) + pd.Timedelta(days=1), side='left')
+        return table.slice(start, end - start).to_pandas()
+
+def _columnar_row_count(path: str) -> int:
+    """
+    列指向形式のキャッシュの行数をファイルのメタデータから取得（データ本体は読まない）
+    
+    Args:
+        path: Arrow IPCまたはParquetファイルのパス
+    
+    Returns:
+        int: 行数
+    """
+    if path.endswith(".arrow"):
+        with pa.memory_map(path) as source:
+            reader = pa.ipc.open_file(source)
+            return sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+    return pq.read_metadata(path).num_rows
+
+def _select_master_file(cache_files: List[Tuple[str, str, str]]) -> Tuple[str, str, str]:
+    """
+    キャッシュファイルから最も広い期間のファイル（マスタデータ）を選択
+    
+    期間の日数が最も長いファイルを選び、同じ日数の場合は開始日が早いファイルを優先する。
+    
+    Args:
+        cache_files: (開始日, 終了日, ファイル名) のリスト（空でないこと）
+    
+    Returns:
+        Tuple: 選択したファイルの (開始日, 終了日, ファイル名)
+    """
+    def period_key(cache_file: Tuple[str, str, str]) -> Tuple[int, int]:
+        file_start = date.fromisoformat(cache_file[0])
+        file_end = date.fromisoformat(cache_file[1])
+        return (file_end - file_start).days, -file_start.toordinal()
+    
+    return max(cache_files, key=period_key)
 
 class CacheOnlyDataLoader:
     """キャッシュ専用データローダークラス"""
     
-    def __init__(self, cache_dir: str = "cache"):
+    def __init__(self, cache_dir: str = "cache", max_workers: int = MAX_WORKERS):
         """
         初期化
         
         Args:
             cache_dir: キャッシュディレクトリ
+            max_workers: 一括読み込みの最大ワーカー数
         """
         self.cache_dir = cache_dir
+        self.max_workers = max_workers
         self.logger = logging.getLogger(__name__)
         
         # キャッシュディレクトリの存在確認
         if not os.path.exists(cache_dir):
             raise FileNotFoundError(f"キャッシュディレクトリが見つかりません: {cache_dir}")
+        
+        # キャッシュファイルの索引（ディレクトリの更新時刻が変わった場合のみ再構築）
+        self._index: Dict[Tuple[str, str], List[Tuple[str, str, str]]] = {}
+        self._index_mtime_ns = None
+        self._index_lock = threading.Lock()
+    
+    def _cache_index(self) -> Dict[Tuple[str, str], List[Tuple[str, str, str]]]:
+        """
+        キャッシュファイルの索引を取得
+        
+        Returns:
+            Dict: (銘柄コード, 時間間隔) をキーとした (開始日, 終了日, ファイル名) のリスト
+        """
+        mtime_ns = os.stat(self.cache_dir).st_mtime_ns
+        with self._index_lock:
+            if self._index_mtime_ns != mtime_ns:
+                index = {}
+                for entry in os.scandir(self.cache_dir):
+                    # 形式に合わないファイル（日付でない部分を含む名前など）は索引に含めない
+                    match = CACHE_FILE_PATTERN.fullmatch(entry.name)
+                    if match is None:
+                        continue
+                    
+                    symbol, interval, file_start, file_end = match.groups()
+                    index.setdefault((symbol, interval), []).append((file_start, file_end, entry.name))
+                
+                self._index = index
+                self._index_mtime_ns = mtime_ns
+            
+            return self._index
+    
+    def _columnar_sibling(self, master_cache_file: str) -> Optional[str]:
+        """
+        マスタデータ（pickle）に対応する列指向形式のファイルを取得
+        （Arrow IPC → Parquetの順で優先）
+        
+        Args:
+            master_cache_file: マスタデータファイルのパス（.pkl）
+        
+        Returns:
+            Optional[str]: 列指向形式のファイルのパス（存在しない・pickleより古い場合はNone）
+        """
+        if pa is None:
+            return None
+        
+        stem = master_cache_file[:-len(".pkl")]
+        for extension in COLUMNAR_EXTENSIONS:
+            columnar_file = stem + extension
+            try:
+                # 差分取得でpickleが更新された後の古いファイルは使用しない
+                if os.path.getmtime(columnar_file) >= os.path.getmtime(master_cache_file):
+                    return columnar_file
+            except OSError:
+                continue
+        
+        return None
+    
+    def _read_master(self, master_cache_file: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        マスタデータを読み込み
+        
+        列指向形式のファイルがある場合は要求期間のみを読み込む（Arrow IPCはメモリマップした
+        バッファをそのまま切り出し、Parquetは期間外の行グループを読み飛ばす）。
+        ない場合はpickleから全期間を読み込む。
+        
+        Args:
+            master_cache_file: マスタデータファイルのパス（.pkl）
+            start_date: 開始日
+            end_date: 終了日
+        
+        Returns:
+            DataFrame: マスタデータ（列指向形式の場合は要求期間のみ。プロセス内のキャッシュと
+            共有されるため変更しないこと。呼び出し元で要求期間を切り出してからコピーする）
+        """
+        # 読み込み結果はプロセス内でキャッシュする（全期間のコピーは作らない）
+        columnar_file = self._columnar_sibling(master_cache_file)
+        if columnar_file is not None:
+            loader = _load_arrow_range if columnar_file.endswith(".arrow") else _load_parquet_range
+            try:
+                return loader(
+                    columnar_file, os.stat(columnar_file).st_mtime_ns, start_date, end_date
+                )
+            except Exception as e:
+                self.logger.warning(f"列指向キャッシュ読み込みエラー、pickleを使用: {columnar_file}, {e}")
+        
+        return _load_pickle_master(master_cache_file, os.stat(master_cache_file).st_mtime_ns)
+    
+    def _cache_row_count(self, master_cache_file: str) -> int:
+        """
+        マスタデータの行数を取得
+        
+        列指向形式のファイルがある場合はメタデータの行数のみを読む。
+        ない場合はpickleを読み込む（プロセス内のキャッシュに載るため、続く読み込みで再利用される）。
+        
+        Args:
+            master_cache_file: マスタデータファイルのパス（.pkl）
+        
+        Returns:
+            int: 行数
+        """
+        columnar_file = self._columnar_sibling(master_cache_file)
+        if columnar_file is not None:
+            try:
+                return _columnar_row_count(columnar_file)
+            except Exception as e:
+                self.logger.warning(f"列指向キャッシュ読み込みエラー、pickleを使用: {columnar_file}, {e}")
+        
+        return len(_load_pickle_master(master_cache_file, os.stat(master_cache_file).st_mtime_ns))
+    
+    def clear_master_cache(self):
+        """プロセス内のマスタデータキャッシュ（pickle・Parquet・Arrow IPC）を破棄（メモリ解放用）"""
+        _load_pickle_master.cache_clear()
+        _load_parquet_range.cache_clear()
+        _load_arrow_range.cache_clear()
     
     def get_stock_data_from_cache(self, symbol: str, start_date: str, 
                                  end_date: str, interval: str = "1d") -> pd.DataFrame:
@@ -44,56 +288,30 @@ class CacheOnlyDataLoader:
         Raises:
             FileNotFoundError: キャッシュファイルが見つからない場合
         """
-        # マスタデータファイルを検索（最も広い期間のファイル）
-        all_cache_files = [f for f in os.listdir(self.cache_dir) 
-                          if f.startswith(f"{symbol}_{interval}_") and f.endswith(".pkl")]
+        # マスタデータファイルを検索（索引から銘柄・時間間隔で取得）
+        all_cache_files = self._cache_index().get((symbol, interval), [])
         
         if not all_cache_files:
             raise FileNotFoundError(f"キャッシュファイルが見つかりません: {symbol}")
         
         # 最も広い期間のファイル（マスタデータ）を選択
-        master_file = None
-        master_start = None
-        master_end = None
-        
-        for cache_file_name in all_cache_files:
-            try:
-                # ファイル名から期間を抽出
-                parts = cache_file_name.replace(f"{symbol}_{interval}_", "").replace(".pkl", "").split("_")
-                if len(parts) >= 2:
-                    file_start = parts[0]
-                    file_end = parts[1]
-                    
-                    # 最も広い期間のファイルを選択
-                    if (master_start is None or file_start <= master_start) and \
-                       (master_end is None or file_end >= master_end):
-                        master_file = cache_file_name
-                        master_start = file_start
-                        master_end = file_end
-                        
-            except Exception as e:
-                self.logger.warning(f"ファイル名解析エラー: {cache_file_name}, {e}")
-                continue
-        
-        if not master_file:
-            raise FileNotFoundError(f"有効なキャッシュファイルが見つかりません: {symbol}")
+        master_start, master_end, master_file = _select_master_file(all_cache_files)
         
         # マスタデータファイルからデータを読み込み
         master_cache_file = os.path.join(self.cache_dir, master_file)
         self.logger.info(f"マスタデータファイルを使用: {master_file}")
         
         try:
-            with open(master_cache_file, 'rb') as f:
-                master_data = pickle.load(f)
+            master_data = self._read_master(master_cache_file, start_date, end_date)
             
             if master_data.empty:
                 raise ValueError(f"マスタデータファイルが空です: {master_cache_file}")
             
             self.logger.info(f"マスタデータ読み込み: {symbol} ({len(master_data)}行, {master_start} ～ {master_end})")
             
-            # 要求された期間にスライス
+            # 要求された期間にスライス（共有のマスタデータは変更させないよう切り出した分のみコピー）
             try:
-                sliced_data = master_data.loc[start_date:end_date]
+                sliced_data = master_data.loc[start_date:end_date].copy()
                 if sliced_data.empty:
                     self.logger.warning(f"スライス後のデータが空です: {symbol} ({start_date} ～ {end_date})")
                     # 空のDataFrameでも返す（エラーにしない）
@@ -105,7 +323,7 @@ class CacheOnlyDataLoader:
             except Exception as e:
                 self.logger.warning(f"期間スライスエラー: {symbol}, {e}")
                 self.logger.info(f"マスタデータをそのまま返します: {symbol} ({len(master_data)}行)")
-                return master_data
+                return master_data.copy()
                 
         except Exception as e:
             if "numpy._core" in str(e):
@@ -131,23 +349,80 @@ class CacheOnlyDataLoader:
         Returns:
             Dict: 銘柄コードをキーとしたデータ辞書
         """
-        all_data = {}
-        missing_symbols = []
+        loaded = {}
+        errors = {}
+        
+        # ファイル読み込みと復元はI/O待ちが中心のため、スレッドで並列化
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            future_to_symbol = {
+                executor.submit(self.get_stock_data_from_cache, symbol, start_date, end_date, interval): symbol
+                for symbol in symbols
+            }
+            
+            for future in concurrent.futures.as_completed(future_to_symbol):
+                symbol = future_to_symbol[future]
+                try:
+                    loaded[symbol] = future.result()
+                except (FileNotFoundError, ValueError) as e:
+                    errors[symbol] = e
         
-        for symbol in symbols:
-            try:
-                data = self.get_stock_data_from_cache(symbol, start_date, end_date, interval)
-                all_data[symbol] = data
-            except (FileNotFoundError, ValueError) as e:
-                missing_symbols.append(symbol)
-                self.logger.warning(f"銘柄データ取得失敗: {symbol}, {e}")
+        # 結果は要求された銘柄順に並べる
+        all_data = {symbol: loaded[symbol] for symbol in symbols if symbol in loaded}
+        missing_symbols = [symbol for symbol in symbols if symbol in errors]
         
         if missing_symbols:
-            self.logger.warning(f"取得できなかった銘柄: {missing_symbols}")
+            self.logger.warning(
+                f"取得できなかった銘柄: {missing_symbols} "
+                f"({'; '.join(f'{symbol}: {errors[symbol]}' for symbol in missing_symbols)})"
+            )
         
         self.logger.info(f"キャッシュからデータ取得完了: {len(all_data)}/{len(symbols)}銘柄")
         return all_data
     
+    def iter_stock_data_from_cache(self, symbols: List[str], 
+                                   start_date: str, end_date: str, 
+                                   interval: str = "1d") -> Iterator[Tuple[str, Optional[pd.DataFrame]]]:
+        """
+        複数銘柄のデータをキャッシュから順に取得（後続銘柄の読み込みを先行して実行）
+        
+        呼び出し元が1銘柄を処理している間に、スレッドで次の銘柄のファイルを読み込む。
+        先行して読み込む銘柄数はワーカー数までに制限する。
+        
+        Args:
+            symbols: 銘柄コードリスト
+            start_date: 開始日
+            end_date: 終了日
+            interval: 時間間隔
+        
+        Yields:
+            Tuple: (銘柄コード, データ) を要求された銘柄順に返す（取得できない場合のデータはNone）
+        """
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        pending = deque()
+        remaining = iter(symbols)
+        
+        try:
+            while True:
+                # 先行読み込みの枠が空いている分だけ次の銘柄を投入
+                for symbol in itertools.islice(remaining, self.max_workers - len(pending)):
+                    pending.append((symbol, executor.submit(
+                        self.get_stock_data_from_cache, symbol, start_date, end_date, interval
+                    )))
+                
+                if not pending:
+                    return
+                
+                symbol, future = pending.popleft()
+                try:
+                    data = future.result()
+                except (FileNotFoundError, ValueError):
+                    data = None
+                
+                yield symbol, data
+        finally:
+            # 途中で打ち切られた場合は未着手の読み込みを破棄
+            executor.shutdown(wait=True, cancel_futures=True)
+    
     def get_vix_data_from_cache(self, start_date: str, end_date: str) -> pd.DataFrame:
         """
         VIXデータをキャッシュから取得
@@ -161,48 +436,21 @@ class CacheOnlyDataLoader:
             DataFrame: VIXデータ
         """
         # VIXマスタデータファイルを検索（最も広い期間のファイル）
-        vix_cache_files = [f for f in os.listdir(self.cache_dir) 
-                          if f.startswith("VIX_1d_") and f.endswith(".pkl")]
+        vix_cache_files = self._cache_index().get(("VIX", "1d"), [])
         
         if not vix_cache_files:
             self.logger.warning(f"VIXキャッシュファイルが見つかりません")
             return pd.DataFrame()
         
         # 最も広い期間のファイル（マスタデータ）を選択
-        master_file = None
-        master_start = None
-        master_end = None
-        
-        for cache_file_name in vix_cache_files:
-            try:
-                # ファイル名から期間を抽出
-                parts = cache_file_name.replace("VIX_1d_", "").replace(".pkl", "").split("_")
-                if len(parts) >= 2:
-                    file_start = parts[0]
-                    file_end = parts[1]
-                    
-                    # 最も広い期間のファイルを選択
-                    if (master_start is None or file_start <= master_start) and \
-                       (master_end is None or file_end >= master_end):
-                        master_file = cache_file_name
-                        master_start = file_start
-                        master_end = file_end
-                        
-            except Exception as e:
-                self.logger.warning(f"VIXファイル名解析エラー: {cache_file_name}, {e}")
-                continue
-        
-        if not master_file:
-            self.logger.warning(f"有効なVIXキャッシュファイルが見つかりません")
-            return pd.DataFrame()
+        master_start, master_end, master_file = _select_master_file(vix_cache_files)
         
         # VIXマスタデータファイルからデータを読み込み
         master_cache_file = os.path.join(self.cache_dir, master_file)
         self.logger.info(f"VIXマスタデータファイルを使用: {master_file}")
         
         try:
-            with open(master_cache_file, 'rb') as f:
-                master_data = pickle.load(f)
+            master_data = self._read_master(master_cache_file, start_date, end_date)
             
             if master_data.empty:
                 self.logger.warning(f"VIXマスタデータファイルが空です: {master_cache_file}")
@@ -210,9 +458,9 @@ class CacheOnlyDataLoader:
             
             self.logger.info(f"VIXマスタデータ読み込み: {len(master_data)}行, {master_start} ～ {master_end}")
             
-            # 要求された期間にスライス
+            # 要求された期間にスライス（共有のマスタデータは変更させないよう切り出した分のみコピー）
             try:
-                sliced_data = master_data.loc[start_date:end_date]
+                sliced_data = master_data.loc[start_date:end_date].copy()
                 if sliced_data.empty:
                     self.logger.warning(f"VIXスライス後のデータが空です: {start_date} ～ {end_date}")
                     # 空のDataFrameでも返す（エラーにしない）
@@ -224,7 +472,7 @@ class CacheOnlyDataLoader:
             except Exception as e:
                 self.logger.warning(f"VIX期間スライスエラー: {e}")
                 self.logger.info(f"VIXマスタデータをそのまま返します: {len(master_data)}行")
-                return master_data
+                return master_data.copy()
                 
         except Exception as e:
             if "numpy._core" in str(e):
@@ -252,18 +500,26 @@ class CacheOnlyDataLoader:
         """
         completeness = {}
         
+        # ディレクトリを1回走査して存在するファイルを取得（銘柄ごとの存在確認を避ける）
+        file_names = set()
+        if os.path.isdir(self.cache_dir):
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".pkl"):
+                        file_names.add(entry.name)
+        
         for symbol in symbols:
-            cache_file = os.path.join(self.cache_dir, 
-                                     f"{symbol}_{interval}_{start_date}_{end_date}.pkl")
+            file_name = f"{symbol}_{interval}_{start_date}_{end_date}.pkl"
             
-            if os.path.exists(cache_file):
-                try:
-                    with open(cache_file, 'rb') as f:
-                        data = pickle.load(f)
-                    completeness[symbol] = not data.empty
-                except:
-                    completeness[symbol] = False
-            else:
+            if file_name not in file_names:
+                completeness[symbol] = False
+                continue
+            
+            try:
+                completeness[symbol] = self._cache_row_count(
+                    os.path.join(self.cache_dir, file_name)
+                ) > 0
+            except Exception:
                 completeness[symbol] = False
         
         complete_count = sum(completeness.values())
@@ -284,19 +540,9 @@ class CacheOnlyDataLoader:
         available_symbols = set()
         
         try:
-            # キャッシュディレクトリの全ファイルを取得
-            cache_files = os.listdir(self.cache_dir)
-            
-            # 株価データファイルのみを抽出（VIXファイルは除外）
-            stock_files = [f for f in cache_files 
-                          if f.endswith('.pkl') and not f.startswith('VIX_')]
-            
-            for file_name in stock_files:
-                # ファイル名から銘柄シンボルを抽出
-                # 形式: {symbol}_{interval}_{start_date}_{end_date}.pkl
-                parts = file_name.split('_')
-                if len(parts) >= 3 and parts[1] == interval:
-                    symbol = parts[0]
+            # キャッシュファイルの索引から株価データの銘柄を抽出（VIXは除外）
+            for symbol, file_interval in self._cache_index():
+                if file_interval == interval and symbol != 'VIX':
                     available_symbols.add(symbol)
             
             symbol_list = sorted(list(available_symbols))
@@ -359,18 +605,17 @@ class CacheOnlyDataLoader:
         Returns:
             DataFrame: クリーニング済みデータ
         """
-        # 欠損値の処理
-        data = data.dropna()
-        
-        # 異常値の処理（価格が0以下の場合）
-        data = data[data['Close'] > 0]
-        data = data[data['Volume'] >= 0]
+        # 欠損値・異常値（価格が0以下の場合）の行を1つのマスクにまとめる
+        keep = (data['Close'].to_numpy() > 0) & (data['Volume'].to_numpy() >= 0)
+        keep &= data.notna().all(axis=1).to_numpy()
         
-        # 重複データの削除
-        data = data[~data.index.duplicated(keep='first')]
+        # 重複データの削除（除外されなかった行の中で最初の1行を残す）
+        keep[keep] = ~data.index[keep].duplicated(keep='first')
+        data = data[keep]
         
-        # 日付順にソート
-        data = data.sort_index()
+        # 日付順にソート（ソート済みの場合は省略）
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index()
         
         return data
     
@@ -388,16 +633,16 @@ class CacheOnlyDataLoader:
             return False
         
         # 必要なカラムの確認
-        required_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-        if not all(col in data.columns for col in required_columns):
+        if not REQUIRED_COLUMN_SET.issubset(data.columns):
             return False
         
         # データ量の確認（最低30日分）
         if len(data) < 30:
             return False
         
-        # 欠損値の確認
-        if data[required_columns].isnull().any().any():
-            return False
+        # 欠損値の確認（部分DataFrameを作らず列ごとに配列で判定）
+        for column in REQUIRED_COLUMNS:
+            if np.isnan(data[column].to_numpy(dtype=np.float64, na_value=np.nan)).any():
+                return False
         
         return True
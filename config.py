@@ -3,8 +3,36 @@
 """
 
 import os
+import functools
 from datetime import datetime, timedelta
 
+@functools.lru_cache(maxsize=None)
+def _period_for_month(year: int, month: int, years: int) -> tuple:
+    """
+    実行年月に対する期間を計算（結果は実行日の年月のみで決まるためキャッシュ）
+    実行日の前月末日から過去N年を計算
+    
+    Args:
+        year: 実行日の年
+        month: 実行日の月
+        years: 期間の年数
+    
+    Returns:
+        tuple: (start_date, end_date) の文字列タプル
+    """
+    # 実行日の前月末日を計算
+    if month == 1:
+        # 1月の場合は前年12月
+        end_date = datetime(year - 1, 12, 31)
+    else:
+        # その他の月は前月の最終日
+        end_date = datetime(year, month, 1) - timedelta(days=1)
+    
+    # 前月末日から過去N年を計算
+    start_date = datetime(end_date.year - years + 1, end_date.month, 1)
+    
+    return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
+
 # 基本設定
 # データ取得期間（実行日の前月末日まで）
 def get_data_period(execution_date: datetime = None) -> tuple:
@@ -21,21 +49,10 @@ def get_data_period(execution_date: datetime = None) -> tuple:
     if execution_date is None:
         execution_date = datetime.now()
     
-    # 実行日の前月末日を計算
-    if execution_date.month == 1:
-        # 1月の場合は前年12月
-        end_date = datetime(execution_date.year - 1, 12, 31)
-    else:
-        # その他の月は前月の最終日
-        end_date = datetime(execution_date.year, execution_date.month, 1) - timedelta(days=1)
-    
-    # 前月末日から過去20年を計算
-    start_date = datetime(end_date.year - 20 + 1, end_date.month, 1)
-    
-    return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
+    return _period_for_month(execution_date.year, execution_date.month, 20)
 
 # デフォルトのデータ取得期間（現在日時基準）
-DATA_START_DATE, DATA_END_DATE = get_data_period()
+# DATA_START_DATE / DATA_END_DATE は初回参照時に計算（モジュール末尾の__getattr__を参照）
 
 # バックテスト期間（戦略別）
 SWING_TRADING_YEARS = 5  # スイングトレード: 5年
@@ -64,18 +81,7 @@ def get_backtest_period(strategy: str, execution_date: datetime = None) -> tuple
     else:
         years = SWING_TRADING_YEARS  # デフォルト
     
-    # 実行日の前月末日を計算
-    if execution_date.month == 1:
-        # 1月の場合は前年12月
-        end_date = datetime(execution_date.year - 1, 12, 31)
-    else:
-        # その他の月は前月の最終日
-        end_date = datetime(execution_date.year, execution_date.month, 1) - timedelta(days=1)
-    
-    # 前月末日から過去N年を計算
-    start_date = datetime(end_date.year - years + 1, end_date.month, 1)
-    
-    return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
+    return _period_for_month(execution_date.year, execution_date.month, years)
 
 def get_dynamic_backtest_period(strategy: str) -> tuple:
     """
@@ -86,7 +92,7 @@ def get_dynamic_backtest_period(strategy: str) -> tuple:
 
 # 後方互換性のため（既存コード用）
 START_DATE = "2020-01-01"
-END_DATE = datetime.now().strftime("%Y-%m-%d")
+# END_DATE は初回参照時に計算（モジュール末尾の__getattr__を参照）
 INITIAL_CAPITAL = 10000000  # 1000万円
 
 # パフォーマンス設定
@@ -196,3 +202,35 @@ GITHUB_ACTIONS = {
     "schedule": "0 6 * * *",  # 毎日朝6時に実行
     "timezone": "Asia/Tokyo"
 }
+
+# 実行日時から決まる設定値（import時ではなく初回参照時に計算）
+LAZY_DATE_SETTINGS = ("DATA_START_DATE", "DATA_END_DATE", "END_DATE")
+
+@functools.lru_cache(maxsize=None)
+def _lazy_date_settings() -> dict:
+    """
+    実行日時から決まる設定値を計算（プロセス内で1回のみ）
+    
+    Returns:
+        dict: 設定名をキーとした日付文字列
+    """
+    data_start_date, data_end_date = get_data_period()
+    return {
+        "DATA_START_DATE": data_start_date,
+        "DATA_END_DATE": data_end_date,
+        "END_DATE": datetime.now().strftime("%Y-%m-%d"),
+    }
+
+def __getattr__(name: str):
+    """
+    実行日時から決まる設定値を遅延評価（既存の from config import END_DATE 等はそのまま利用可能）
+    
+    Args:
+        name: 属性名
+    
+    Returns:
+        str: 設定値
+    """
+    if name in LAZY_DATE_SETTINGS:
+        return _lazy_date_settings()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
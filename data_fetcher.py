@@ -5,7 +5,8 @@
 
 import logging
 import os
-from typing import List, Set, Dict
+import concurrent.futures
+from typing import List, Set, Dict, Tuple, Callable
 from datetime import datetime
 from data_loader import DataLoader
 from config import get_data_period, LOCAL_TEST_MODE
@@ -23,6 +24,29 @@ class DataFetcher:
         self.data_loader = DataLoader(local_test_mode=local_test_mode)
         self.logger = logging.getLogger(__name__)
         self.local_test_mode = local_test_mode
+        
+        # (戦略名, 乱数シード) ごとの銘柄抽出結果（同じ組み合わせは再抽出しない）
+        self._stocks_memo: Dict[Tuple[str, int], List[str]] = {}
+    
+    def _get_strategy_stocks(self, strategy: str, random_seed: int) -> List[str]:
+        """
+        戦略・乱数シードに対応する銘柄リストを取得（抽出結果をメモ化）
+        
+        Args:
+            strategy: 戦略名
+            random_seed: 乱数シード
+        
+        Returns:
+            List[str]: 銘柄リスト
+        """
+        key = (strategy, random_seed)
+        stocks = self._stocks_memo.get(key)
+        if stocks is None:
+            stocks = self.data_loader.get_strategy_stocks(strategy, random_seed)
+            self._stocks_memo[key] = stocks
+        
+        # 呼び出し元での変更がメモに影響しないようコピーを返す
+        return list(stocks)
     
     def collect_all_strategy_stocks(self, strategies: List[str], 
                                    num_runs: int = 3, base_seed: int = 42) -> Set[str]:
@@ -46,7 +70,7 @@ class DataFetcher:
             
             for run_id in range(1, num_runs + 1):
                 random_seed = base_seed + run_id
-                stocks = self.data_loader.get_strategy_stocks(strategy, random_seed)
+                stocks = self._get_strategy_stocks(strategy, random_seed)
                 all_stocks.update(stocks)
                 
                 self.logger.info(f"  {strategy} 実行{run_id}: {len(stocks)}銘柄")
@@ -224,38 +248,78 @@ class DataFetcher:
         """
         self.logger.info("データ完全性を検証中...")
         
-        completeness_info = {}
-        
-        for strategy in strategies:
-            self.logger.info(f"戦略 {strategy} の完全性を検証中...")
-            
-            strategy_completeness = {
-                "total_runs": num_runs,
-                "complete_runs": 0,
-                "missing_stocks": []
+        # キャッシュファイル名はデータ取得期間で決まる
+        data_start_date, data_end_date = get_data_period()
+        
+        # ディレクトリを1回だけ走査し、銘柄ごとの存在確認は集合の参照で行う
+        cache_dir = self.data_loader.cache_dir
+        existing_files = set(os.listdir(cache_dir)) if os.path.isdir(cache_dir) else set()
+        
+        # 複数の実行・戦略で重複する銘柄は1回だけ判定
+        stock_cached = {}
+        
+        def is_cached(stock: str) -> bool:
+            cached = stock_cached.get(stock)
+            if cached is None:
+                cached = f"{stock}_1d_{data_start_date}_{data_end_date}.pkl" in existing_files
+                stock_cached[stock] = cached
+            return cached
+        
+        if not strategies:
+            return {}
+        
+        # 戦略ごとの銘柄抽出は独立しているため並列で検証
+        strategy_results = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(strategies)) as executor:
+            future_to_strategy = {
+                executor.submit(self._validate_strategy_completeness,
+                                strategy, num_runs, base_seed, is_cached): strategy
+                for strategy in strategies
             }
             
-            for run_id in range(1, num_runs + 1):
-                random_seed = base_seed + run_id
-                stocks = self.data_loader.get_strategy_stocks(strategy, random_seed)
-                
-                # 各銘柄のキャッシュ存在確認
-                missing_stocks = []
-                for stock in stocks:
-                    cache_file = f"{stock}_1d_{DATA_START_DATE}_{DATA_END_DATE}.pkl"
-                    if not self.data_loader._file_exists(cache_file):
-                        missing_stocks.append(stock)
-                
-                if not missing_stocks:
-                    strategy_completeness["complete_runs"] += 1
-                else:
-                    strategy_completeness["missing_stocks"].extend(missing_stocks)
+            for future in concurrent.futures.as_completed(future_to_strategy):
+                strategy_results[future_to_strategy[future]] = future.result()
+        
+        # 戦略リストの順序で返す
+        return {strategy: strategy_results[strategy] for strategy in strategies}
+    
+    def _validate_strategy_completeness(self, strategy: str, num_runs: int, base_seed: int,
+                                        is_cached: Callable[[str], bool]) -> Dict:
+        """
+        1戦略分のデータの完全性を検証
+        
+        Args:
+            strategy: 戦略名
+            num_runs: 実行回数
+            base_seed: ベース乱数シード
+            is_cached: 銘柄のキャッシュが存在するかを判定する関数
+        
+        Returns:
+            Dict: 完全性情報
+        """
+        self.logger.info(f"戦略 {strategy} の完全性を検証中...")
+        
+        strategy_completeness = {
+            "total_runs": num_runs,
+            "complete_runs": 0,
+            "missing_stocks": []
+        }
+        
+        for run_id in range(1, num_runs + 1):
+            random_seed = base_seed + run_id
+            stocks = self._get_strategy_stocks(strategy, random_seed)
             
-            completeness_info[strategy] = strategy_completeness
+            # 各銘柄のキャッシュ存在確認
+            missing_stocks = [stock for stock in stocks if not is_cached(stock)]
             
-            self.logger.info(f"  {strategy}: {strategy_completeness['complete_runs']}/{num_runs}回完全")
+            if not missing_stocks:
+                strategy_completeness["complete_runs"] += 1
+            else:
+                strategy_completeness["missing_stocks"].extend(missing_stocks)
+        
+        self.logger.info(f"  {strategy}: {strategy_completeness['complete_runs']}/{num_runs}回完全")
         
-        return completeness_info
+        return strategy_completeness
     
     def get_strategy_stocks_for_run(self, strategy: str, run_id: int, 
                                    base_seed: int = 42) -> List[str]:
@@ -271,7 +335,7 @@ class DataFetcher:
             List[str]: 銘柄リスト
         """
         random_seed = base_seed + run_id
-        return self.data_loader.get_strategy_stocks(strategy, random_seed)
+        return self._get_strategy_stocks(strategy, random_seed)
     
     def check_and_fetch_missing_stocks(self, strategy: str, num_runs: int, base_seed: int, 
                                      start_date: str, end_date: str) -> List[str]:
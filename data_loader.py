@@ -3,20 +3,148 @@
 株価データの取得、キャッシュ、検証、クリーニング
 """
 
+import io
 import os
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 import logging
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 import pickle
 import time
 import concurrent.futures
-from functools import partial
+import threading
+from collections import OrderedDict
+from functools import lru_cache, partial
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.feather as feather
+except ImportError:
+    pa = None
+    pc = None
+    pacsv = None
+    feather = None
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+from config import MAX_WORKERS
+from cache_data_loader import CACHE_FILE_PATTERN, COLUMNAR_EXTENSIONS
+
+# キャッシュ書き込み時のpickleプロトコル
+# （プロトコル5はNumPy配列のバッファを中間のbytesを経由せずに書き出し・復元できる）
+CACHE_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+# プロセス内に保持する株価データの最大件数（銘柄・期間の組み合わせ単位）
+MEMORY_CACHE_SIZE = 256
+
+# 指数銘柄CSVが読み込めない場合のデフォルトの銘柄リスト（呼び出し元には浅いコピーを返す）
+DEFAULT_INDEX_STOCKS = pd.DataFrame({
+    'symbol': ['AAPL', 'MSFT', 'GOOGL', '7203.T', '6758.T', '9984.T'],
+    'name': ['Apple Inc.', 'Microsoft Corporation', 'Alphabet Inc.', 
+            'トヨタ自動車株式会社', 'ソニーグループ株式会社', 'ソフトバンクグループ株式会社'],
+    'index': ['SP500', 'SP500', 'SP500', 'NIKKEI225', 'NIKKEI225', 'NIKKEI225'],
+    'category': ['high', 'high', 'high', 'high', 'high', 'high'],
+    'country': ['US', 'US', 'US', 'JP', 'JP', 'JP'],
+    'description': ['テクノロジー大手', 'ソフトウェア大手', 'インターネット大手', 
+                   '自動車大手', 'エンターテイメント大手', '通信大手']
+})
+
+# 時間間隔からstooq.comの間隔指定への変換
+STOOQ_INTERVALS = {
+    "1d": "d",  # 日足
+    "1wk": "w",  # 週足
+    "1mo": "m",  # 月足
+}
+
+# stooq.comのCSVダウンロードURLとタイムアウト（秒）
+STOOQ_CSV_URL = "https://stooq.com/q/d/l/"
+STOOQ_TIMEOUT = 30
+
+# pandas_datareader.data（初回のstooq.com取得時にインポート）
+_datareader = None
+
+# 株価データに必須の列（validate_dataで存在と欠損を確認）
+REQUIRED_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+REQUIRED_COLUMN_SET = frozenset(REQUIRED_COLUMNS)
+
+@lru_cache(maxsize=8)
+def _resolve_dates(start_date: str, end_date: str) -> Tuple[pd.Timestamp, pd.Timestamp]:
+    """
+    期間指定の日付文字列をTimestampに変換（一括取得では全銘柄で同じ期間のため結果を共有）
+    
+    Args:
+        start_date: 開始日
+        end_date: 終了日
+    
+    Returns:
+        Tuple: (開始日, 終了日)
+    """
+    return pd.Timestamp(start_date), pd.Timestamp(end_date)
+
+def _import_datareader():
+    """
+    pandas_datareader.dataを取得（インポートは初回のみ）
+    
+    キャッシュのみを使う実行でインポート時間がかからないよう、モジュール読み込み時ではなく
+    初回のstooq.com取得時にインポートする。以降はワーカースレッドからインポート機構を経由しない。
+    
+    Returns:
+        module: pandas_datareader.data
+    
+    Raises:
+        ImportError: pandas-datareaderがインストールされていない場合
+    """
+    global _datareader
+    if _datareader is None:
+        import pandas_datareader.data as web
+        _datareader = web
+    return _datareader
+
+def _read_stocks_csv(csv_file: str) -> pd.DataFrame:
+    """
+    銘柄リストCSVを読み込み
+    
+    pyarrowが利用可能な場合はpyarrowのCSVパーサ（マルチスレッド）で読み込む。
+    空欄はpd.read_csvと同じく欠損値として扱う。
+    
+    Args:
+        csv_file: CSVファイルパス
+    
+    Returns:
+        DataFrame: CSVの内容
+    """
+    if pacsv is None:
+        return pd.read_csv(csv_file, encoding='utf-8')
+    
+    convert_options = pacsv.ConvertOptions(strings_can_be_null=True)
+    return pacsv.read_csv(csv_file, convert_options=convert_options).to_pandas()
+
+def _write_arrow(data: pd.DataFrame, path: str):
+    """
+    DataFrameをArrow IPC形式（Feather v2互換）で書き込み
+    
+    メモリマップで直接参照できるよう圧縮せずに書き込む。
+    
+    Args:
+        data: 保存するデータ
+        path: 出力パス
+    """
+    table = pa.Table.from_pandas(data)
+    with pa.OSFile(path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
 
 class DataLoader:
     """データローダークラス"""
     
-    def __init__(self, cache_dir: str = "cache", max_workers: int = 3, local_test_mode: bool = False):
+    def __init__(self, cache_dir: str = "cache", max_workers: int = MAX_WORKERS, local_test_mode: bool = False):
         """
         初期化
         
@@ -29,21 +157,273 @@ class DataLoader:
         self.local_test_mode = local_test_mode
         self.logger = logging.getLogger(__name__)
         
+        # 指数銘柄CSVの読み込み結果（CSVパスごとに (更新時刻, DataFrame, 指数別銘柄リスト)）
+        self._index_stocks_cache: Dict[str, Tuple[int, pd.DataFrame, Dict[str, List[str]]]] = {}
+        
+        # stooq.com取得用のHTTPセッション（初回取得時に作成し、全ワーカーで共有）
+        self._session = None
+        self._session_lock = threading.Lock()
+        
+        # キャッシュファイルの期間情報（パス -> (更新時刻, 最初の日時, 最後の日時)、空の場合は日時がNone）
+        self._cache_range_memo: Dict[str, Tuple[int, Optional[pd.Timestamp], Optional[pd.Timestamp]]] = {}
+        
+        # 取得済み株価データのLRUキャッシュ（(銘柄, 間隔, 開始日, 終了日) -> DataFrame）
+        self._memory_cache: "OrderedDict[Tuple[str, str, str, str], pd.DataFrame]" = OrderedDict()
+        self._memory_cache_lock = threading.Lock()
+        
         # キャッシュディレクトリの作成
         os.makedirs(cache_dir, exist_ok=True)
     
-    def _file_exists(self, filename: str) -> bool:
+    def _get_session(self):
+        """
+        接続プールを共有するHTTPセッションを取得
+        
+        ワーカー間で同じセッションを使い、銘柄ごとのTCP/TLS接続の確立を省く。
+        
+        Returns:
+            requests.Session: HTTPセッション（requests未インストールの場合None）
+        """
+        if requests is None:
+            return None
+        
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                session.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+                adapter = HTTPAdapter(pool_connections=self.max_workers,
+                                      pool_maxsize=self.max_workers * 2)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._session = session
+            return self._session
+    
+    def _get_memory_cache(self, key: Tuple[str, str, str, str]) -> Optional[pd.DataFrame]:
+        """
+        プロセス内キャッシュから株価データを取得
+        
+        Args:
+            key: (銘柄, 間隔, 開始日, 終了日)
+        
+        Returns:
+            DataFrame: 株価データ（キャッシュにない場合None）
+        """
+        with self._memory_cache_lock:
+            data = self._memory_cache.get(key)
+            if data is None:
+                return None
+            self._memory_cache.move_to_end(key)
+        # 呼び出し元での列追加などがキャッシュに波及しないよう浅いコピーを返す
+        return data.copy(deep=False)
+    
+    def _put_memory_cache(self, key: Tuple[str, str, str, str], data: pd.DataFrame) -> pd.DataFrame:
+        """
+        株価データをプロセス内キャッシュに保存（上限を超えた場合は最も古いものを破棄）
+        
+        Args:
+            key: (銘柄, 間隔, 開始日, 終了日)
+            data: 株価データ
+        
+        Returns:
+            DataFrame: 呼び出し元に返すデータ（キャッシュとは別の浅いコピー）
+        """
+        with self._memory_cache_lock:
+            self._memory_cache[key] = data
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+        return data.copy(deep=False)
+    
+    def _read_cache(self, cache_file: str) -> pd.DataFrame:
+        """
+        キャッシュファイルを読み込み
+        
+        pickleより新しい列指向形式のファイル（同名の.arrow → .parquetの順で優先）があれば
+        そちらを読み込む（pickleのオブジェクト復元を行わない。Arrow IPCはメモリマップする）。
+        ない場合はpickleを読み込む。
+        
+        Args:
+            cache_file: キャッシュファイルのパス（.pkl）
+        
+        Returns:
+            DataFrame: キャッシュデータ
+        
+        Raises:
+            FileNotFoundError: キャッシュファイルが存在しない場合
+        """
+        if pa is not None:
+            pickle_mtime_ns = os.stat(cache_file).st_mtime_ns
+            stem = cache_file[:-len('.pkl')]
+            for extension in COLUMNAR_EXTENSIONS:
+                columnar_file = stem + extension
+                try:
+                    # 差分取得でpickleが更新された後の古いファイルは使用しない
+                    if os.stat(columnar_file).st_mtime_ns < pickle_mtime_ns:
+                        continue
+                except FileNotFoundError:
+                    continue
+                
+                try:
+                    if extension == '.arrow':
+                        with pa.memory_map(columnar_file) as source:
+                            return pa.ipc.open_file(source).read_all().to_pandas()
+                    return pd.read_parquet(columnar_file)
+                except Exception as e:
+                    self.logger.warning(f"列指向キャッシュ読み込みエラー: {columnar_file}, {e}")
+        
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    
+    def _peek_cache_range(self, cache_file: str) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        キャッシュファイルのデータ期間を取得（DataFrameを復元せずに確認できる場合は復元しない）
+        
+        結果はファイルの更新時刻とともに保持し、更新されていなければ再利用する。
+        Arrow IPCファイルがあればメモリマップしてインデックス列の最小・最大のみを求める。
+        
+        Args:
+            cache_file: キャッシュファイルのパス（.pkl）
+        
+        Returns:
+            Optional[Tuple]: (最初の日時, 最後の日時)（データが空の場合None）
+        
+        Raises:
+            FileNotFoundError: キャッシュファイルが存在しない場合
+        """
+        mtime_ns = os.stat(cache_file).st_mtime_ns
+        memo = self._cache_range_memo.get(cache_file)
+        if memo is not None and memo[0] == mtime_ns:
+            return None if memo[1] is None else (memo[1], memo[2])
+        
+        cache_range = None
+        if pa is not None:
+            cache_range = self._peek_arrow_range(cache_file[:-len('.pkl')] + '.arrow', mtime_ns)
+        
+        if cache_range is None:
+            data = self._read_cache(cache_file)
+            if not data.empty:
+                index = data.index
+                if index.is_monotonic_increasing:
+                    cache_range = (index[0], index[-1])
+                else:
+                    cache_range = (index.min(), index.max())
+        
+        if cache_range is None:
+            self._cache_range_memo[cache_file] = (mtime_ns, None, None)
+        else:
+            self._cache_range_memo[cache_file] = (mtime_ns, cache_range[0], cache_range[1])
+        return cache_range
+    
+    def _peek_arrow_range(self, arrow_file: str,
+                          pickle_mtime_ns: int) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        Arrow IPCキャッシュのインデックス列から期間を取得
+        
+        Args:
+            arrow_file: Arrow IPCファイルのパス
+            pickle_mtime_ns: 対応するpickleの更新時刻（これより古いファイルは使用しない）
+        
+        Returns:
+            Optional[Tuple]: (最初の日時, 最後の日時)（使用できない場合None）
+        """
+        try:
+            if os.stat(arrow_file).st_mtime_ns < pickle_mtime_ns:
+                return None
+            with pa.memory_map(arrow_file) as source:
+                table = pa.ipc.open_file(source).read_all()
+                index_column = table.schema.pandas_metadata['index_columns'][0]
+                if not isinstance(index_column, str) or table.num_rows == 0:
+                    return None
+                bounds = pc.min_max(table.column(index_column))
+                return pd.Timestamp(bounds['min'].as_py()), pd.Timestamp(bounds['max'].as_py())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Arrowキャッシュ期間取得エラー: {arrow_file}, {e}")
+            return None
+    
+    def _read_overlapping_cache(self, symbol: str, interval: str,
+                                start_date: str, end_date: str) -> pd.DataFrame:
         """
-        ファイルの存在確認
+        同じ銘柄・間隔で別の期間のキャッシュから要求期間と重なる部分を読み込み
+        
+        要求期間と重なる日数が最も長いファイル（同じ場合は期間の長いファイル）を使い、
+        要求期間で切り出して返す。不足分は呼び出し元で差分取得する。
         
         Args:
-            filename: ファイル名
+            symbol: 銘柄コード
+            interval: 時間間隔
+            start_date: 要求開始日
+            end_date: 要求終了日
         
         Returns:
-            bool: ファイルの存在
+            DataFrame: 要求期間内の既存データ（該当するキャッシュがない場合は空）
+        """
+        start_ts, end_ts = _resolve_dates(start_date, end_date)
+        prefix = f"{symbol}_{interval}_"
+        best_key = None
+        best_file = None
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if not entry.name.startswith(prefix):
+                        continue
+                    match = CACHE_FILE_PATTERN.fullmatch(entry.name)
+                    if match is None or match['symbol'] != symbol or match['interval'] != interval:
+                        continue
+                    
+                    file_start = pd.Timestamp(match['start'])
+                    file_end = pd.Timestamp(match['end'])
+                    overlap = min(end_ts, file_end) - max(start_ts, file_start)
+                    if overlap < pd.Timedelta(0):
+                        continue
+                    
+                    key = (overlap, file_end - file_start)
+                    if best_key is None or key > best_key:
+                        best_key = key
+                        best_file = entry.path
+        except FileNotFoundError:
+            return pd.DataFrame()
+        
+        if best_file is None:
+            return pd.DataFrame()
+        
+        try:
+            data = self._read_cache(best_file)
+        except Exception as e:
+            self.logger.warning(f"既存期間キャッシュ読み込みエラー: {best_file}, {e}")
+            return pd.DataFrame()
+        
+        if data.empty:
+            return data
+        
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index()
+        # 切り出しは元の全期間データのビューのため、要求期間分のみコピーして保持・保存する
+        data = data.loc[start_ts:end_ts].copy()
+        self.logger.info(f"別期間のキャッシュを再利用: {symbol} ({os.path.basename(best_file)}, {len(data)}行)")
+        return data
+    
+    def _write_cache(self, data: pd.DataFrame, cache_file: str):
+        """
+        キャッシュファイルを書き込み
+        
+        pickle（差分取得・キャッシュ確認で使用）に加え、pyarrowが利用可能な場合は
+        同名のArrow IPCファイル（.arrow）も書き込む。
+        
+        Args:
+            data: 保存するデータ
+            cache_file: キャッシュファイルのパス（.pkl）
         """
-        filepath = os.path.join(self.cache_dir, filename)
-        return os.path.exists(filepath)
+        with open(cache_file, 'wb') as f:
+            pickle.dump(data, f, protocol=CACHE_PICKLE_PROTOCOL)
+        
+        # pickleの後に書き込み、更新時刻がpickle以降になるようにする
+        if pa is not None and not data.empty:
+            arrow_file = cache_file[:-len('.pkl')] + '.arrow'
+            try:
+                _write_arrow(data, arrow_file)
+            except Exception as e:
+                self.logger.warning(f"Arrowキャッシュ保存エラー: {arrow_file}, {e}")
     
     def get_stock_data(self, symbol: str, start_date: str = "2020-01-01", 
                        end_date: str = "2025-08-31", interval: str = "1d", 
@@ -61,18 +441,27 @@ class DataLoader:
         Returns:
             DataFrame: 株価データ
         """
+        # 同じプロセスで取得済みの場合はディスクを読まずに返す
+        memory_key = (symbol, interval, start_date, end_date)
+        cached_data = self._get_memory_cache(memory_key)
+        if cached_data is not None:
+            self.logger.info(f"メモリキャッシュから取得: {symbol}")
+            return cached_data
+        
         cache_file = os.path.join(self.cache_dir, f"{symbol}_{interval}_{start_date}_{end_date}.pkl")
         
-        # 既存のキャッシュデータを読み込み
+        # 既存のキャッシュデータを読み込み（同じ期間のファイルがない場合は別期間のファイルから）
         existing_data = pd.DataFrame()
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'rb') as f:
-                    existing_data = pickle.load(f)
-                if not existing_data.empty:
-                    self.logger.info(f"既存キャッシュを読み込み: {symbol}")
-            except Exception as e:
-                self.logger.warning(f"キャッシュ読み込みエラー: {symbol}, {e}")
+        from_other_period = False
+        try:
+            existing_data = self._read_cache(cache_file)
+            if not existing_data.empty:
+                self.logger.info(f"既存キャッシュを読み込み: {symbol}")
+        except FileNotFoundError:
+            existing_data = self._read_overlapping_cache(symbol, interval, start_date, end_date)
+            from_other_period = not existing_data.empty
+        except Exception as e:
+            self.logger.warning(f"キャッシュ読み込みエラー: {symbol}, {e}")
         
         # 不足している期間を特定
         missing_periods = self._get_missing_periods(existing_data, start_date, end_date)
@@ -80,13 +469,24 @@ class DataLoader:
         if not missing_periods:
             # データが完全に揃っている場合
             self.logger.info(f"キャッシュから完全なデータを取得: {symbol}")
-            return existing_data
+            if from_other_period:
+                # 要求期間のキャッシュとして保存（キャッシュ確認はファイル名の期間で行うため）
+                try:
+                    self._write_cache(existing_data, cache_file)
+                except Exception as e:
+                    self.logger.warning(f"キャッシュ保存エラー: {symbol}, {e}")
+            return self._put_memory_cache(memory_key, existing_data)
         
         # 不足している期間のデータを取得
         self.logger.info(f"差分データ取得開始: {symbol} (不足期間: {len(missing_periods)}個)")
+        fetch_periods = missing_periods
+        if len(missing_periods) == 2:
+            # 前後の不足期間は1回のリクエストにまとめる（既存データと重なる内側は取得後に除く）
+            fetch_periods = [(missing_periods[0][0], missing_periods[1][1])]
+        
         new_data_parts = []
-        for i, (period_start, period_end) in enumerate(missing_periods, 1):
-            self.logger.info(f"不足期間 {i}/{len(missing_periods)} のデータを取得: {symbol} ({period_start} 〜 {period_end})")
+        for i, (period_start, period_end) in enumerate(fetch_periods, 1):
+            self.logger.info(f"不足期間 {i}/{len(fetch_periods)} のデータを取得: {symbol} ({period_start} 〜 {period_end})")
             
             try:
                 period_data = self._get_from_stooq(symbol, period_start, period_end, interval, max_retries)
@@ -100,30 +500,35 @@ class DataLoader:
         
         # 新規データをマージ
         if new_data_parts:
-            new_data = pd.concat(new_data_parts)
-            new_data = new_data[~new_data.index.duplicated(keep='first')]
-            new_data = new_data.sort_index()
+            new_data = pd.concat(new_data_parts) if len(new_data_parts) > 1 else new_data_parts[0]
+            if not (new_data.index.is_monotonic_increasing and new_data.index.is_unique):
+                new_data = new_data[~new_data.index.duplicated(keep='first')]
+                new_data = new_data.sort_index()
+            
+            if len(fetch_periods) < len(missing_periods):
+                # 不足期間ごとに取得した場合と同じ行（境界日を含む前後の期間）のみ残す
+                head_end = pd.Timestamp(missing_periods[0][1])
+                tail_start = pd.Timestamp(missing_periods[1][0])
+                new_data = new_data[(new_data.index <= head_end) | (new_data.index >= tail_start)]
             
             self.logger.info(f"新規データマージ: {symbol} (新規: {len(new_data)}行, 既存: {len(existing_data)}行)")
             
             # 既存データとマージ
             final_data = self._merge_data(existing_data, new_data)
             
-            # 要求期間でフィルタリング
-            final_data = final_data[
-                (final_data.index >= pd.to_datetime(start_date)) & 
-                (final_data.index <= pd.to_datetime(end_date))
-            ]
+            # 要求期間でフィルタリング（マージ後は日付順のため二分探索で切り出す）
+            # 切り出しはマージ結果のビューのため、連続した配列にコピーしてから保存する
+            start_ts, end_ts = _resolve_dates(start_date, end_date)
+            final_data = final_data.loc[start_ts:end_ts].copy()
             
             # キャッシュに保存
             try:
-                with open(cache_file, 'wb') as f:
-                    pickle.dump(final_data, f)
+                self._write_cache(final_data, cache_file)
                 self.logger.info(f"差分データ取得完了: {symbol} (最終: {len(final_data)}行, 新規追加: {len(new_data)}行)")
             except Exception as e:
                 self.logger.warning(f"キャッシュ保存エラー: {symbol}, {e}")
             
-            return final_data
+            return self._put_memory_cache(memory_key, final_data)
         else:
             # 新規データが取得できなかった場合
             if not existing_data.empty:
@@ -133,6 +538,79 @@ class DataLoader:
                 self.logger.error(f"データ取得完全失敗: {symbol}")
                 return pd.DataFrame()
     
+    def convert_cache_to_parquet(self, row_group_size: int = 252) -> int:
+        """
+        キャッシュ（pickle）を列指向形式（Parquet）に変換
+        
+        キャッシュ専用ローダーは同名の.parquetファイルがあれば優先して読み込み、
+        要求期間外の行グループを読み飛ばす。pickleは差分取得の書き込み先として残す。
+        
+        Args:
+            row_group_size: 行グループの行数（日足で約1年分）
+        
+        Returns:
+            int: 変換したファイル数
+        """
+        return self._convert_cache(
+            '.parquet', lambda data, path: data.to_parquet(path, row_group_size=row_group_size)
+        )
+    
+    def convert_cache_to_arrow(self) -> int:
+        """
+        キャッシュ（pickle）をArrow IPC形式に変換
+        
+        キャッシュ専用ローダーは同名の.arrowファイルを最優先で読み込み、メモリマップした
+        列バッファから要求期間のみを切り出す（オブジェクトの復元処理が不要）。
+        メモリマップで直接参照できるよう圧縮せずに書き込む。
+        
+        Returns:
+            int: 変換したファイル数
+        """
+        return self._convert_cache('.arrow', _write_arrow)
+    
+    def _convert_cache(self, extension: str, write) -> int:
+        """
+        キャッシュ（pickle）を同名の列指向形式のファイルに変換
+        
+        Args:
+            extension: 変換後の拡張子
+            write: DataFrameと出力パスを受け取って書き込む関数
+        
+        Returns:
+            int: 変換したファイル数
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            self.logger.warning(f"pyarrowがインストールされていないため、{extension}変換をスキップします")
+            return 0
+        
+        converted = 0
+        for file_name in os.listdir(self.cache_dir):
+            if not file_name.endswith('.pkl'):
+                continue
+            
+            cache_file = os.path.join(self.cache_dir, file_name)
+            columnar_file = cache_file[:-len('.pkl')] + extension
+            
+            # 変換済みで、その後pickleが更新されていない場合はスキップ
+            if os.path.exists(columnar_file) and os.path.getmtime(columnar_file) >= os.path.getmtime(cache_file):
+                continue
+            
+            try:
+                with open(cache_file, 'rb') as f:
+                    data = pickle.load(f)
+                if not isinstance(data, pd.DataFrame) or data.empty:
+                    continue
+                
+                write(data.sort_index(), columnar_file)
+                converted += 1
+            except Exception as e:
+                self.logger.warning(f"{extension}変換エラー: {file_name}, {e}")
+        
+        self.logger.info(f"{extension}変換完了: {converted}ファイル")
+        return converted
+    
     def _get_missing_periods(self, existing_data: pd.DataFrame, start_date: str, end_date: str) -> list:
         """
         不足している期間を特定
@@ -149,22 +627,44 @@ class DataLoader:
             self.logger.info(f"既存データなし、全期間を取得: {start_date} 〜 {end_date}")
             return [(start_date, end_date)]
         
-        # 既存データの期間を確認
-        existing_start = existing_data.index.min().strftime('%Y-%m-%d')
-        existing_end = existing_data.index.max().strftime('%Y-%m-%d')
+        # 既存データの期間を確認（キャッシュは日付順のため両端を参照）
+        index = existing_data.index
+        if index.is_monotonic_increasing:
+            existing_start, existing_end = index[0], index[-1]
+        else:
+            existing_start, existing_end = index.min(), index.max()
+        return self._get_missing_periods_for_range(existing_start, existing_end, start_date, end_date)
+    
+    def _get_missing_periods_for_range(self, existing_start: pd.Timestamp, existing_end: pd.Timestamp,
+                                       start_date: str, end_date: str) -> list:
+        """
+        既存データの期間から不足している期間を特定
+        
+        Args:
+            existing_start: 既存データの最初の日時
+            existing_end: 既存データの最後の日時
+            start_date: 要求開始日
+            end_date: 要求終了日
+        
+        Returns:
+            list: 不足期間のリスト [(start, end), ...]
+        """
+        existing_start = existing_start.normalize()
+        existing_end = existing_end.normalize()
+        start_ts, end_ts = _resolve_dates(start_date, end_date)
         
         self.logger.info(f"要求期間: {start_date} 〜 {end_date}")
-        self.logger.info(f"既存データ期間: {existing_start} 〜 {existing_end}")
+        self.logger.info(f"既存データ期間: {existing_start:%Y-%m-%d} 〜 {existing_end:%Y-%m-%d}")
         
         missing_periods = []
         
         # 開始日より前の期間
-        if start_date < existing_start:
-            missing_periods.append((start_date, existing_start))
+        if start_ts < existing_start:
+            missing_periods.append((start_date, existing_start.strftime('%Y-%m-%d')))
         
         # 終了日より後の期間
-        if end_date > existing_end:
-            missing_periods.append((existing_end, end_date))
+        if end_ts > existing_end:
+            missing_periods.append((existing_end.strftime('%Y-%m-%d'), end_date))
         
         if missing_periods:
             self.logger.info(f"不足期間を特定: {missing_periods}")
@@ -187,6 +687,18 @@ class DataLoader:
         if existing_data.empty:
             return new_data
         
+        existing_index = existing_data.index
+        new_index = new_data.index
+        if not new_data.empty and \
+           existing_index.is_monotonic_increasing and existing_index.is_unique and \
+           new_index.is_monotonic_increasing and new_index.is_unique:
+            # 新規データが既存データの後ろ（または前）にのみ続く場合は、重なる日を
+            # 既存データから除いて連結するだけで済む（重複除去・ソートが不要）
+            if new_index[0] >= existing_index[-1]:
+                return pd.concat([existing_data[existing_index < new_index[0]], new_data])
+            if new_index[-1] <= existing_index[0]:
+                return pd.concat([new_data, existing_data[existing_index > new_index[-1]]])
+        
         # データを結合
         merged_data = pd.concat([existing_data, new_data])
         
@@ -212,17 +724,17 @@ class DataLoader:
             return False
         
         # 必要なカラムの確認
-        required_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-        if not all(col in data.columns for col in required_columns):
+        if not REQUIRED_COLUMN_SET.issubset(data.columns):
             return False
         
         # データ量の確認（最低30日分）
         if len(data) < 30:
             return False
         
-        # 欠損値の確認
-        if data[required_columns].isnull().any().any():
-            return False
+        # 欠損値の確認（部分DataFrameを作らず列ごとに配列で判定）
+        for column in REQUIRED_COLUMNS:
+            if np.isnan(data[column].to_numpy(dtype=np.float64, na_value=np.nan)).any():
+                return False
         
         return True
     
@@ -236,18 +748,17 @@ class DataLoader:
         Returns:
             DataFrame: クリーニング済みデータ
         """
-        # 欠損値の処理
-        data = data.dropna()
+        # 欠損値・異常値（価格が0以下の場合）の行を1つのマスクにまとめる
+        keep = (data['Close'].to_numpy() > 0) & (data['Volume'].to_numpy() >= 0)
+        keep &= data.notna().all(axis=1).to_numpy()
         
-        # 異常値の処理（価格が0以下の場合）
-        data = data[data['Close'] > 0]
-        data = data[data['Volume'] >= 0]
+        # 重複データの削除（除外されなかった行の中で最初の1行を残す）
+        keep[keep] = ~data.index[keep].duplicated(keep='first')
+        data = data[keep]
         
-        # 重複データの削除
-        data = data[~data.index.duplicated(keep='first')]
-        
-        # 日付順にソート
-        data = data.sort_index()
+        # 日付順にソート（ソート済みの場合は省略）
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index()
         
         return data
     
@@ -255,8 +766,6 @@ class DataLoader:
                         interval: str, max_retries: int) -> pd.DataFrame:
         """stooq.comからデータ取得（リトライなし）"""
         try:
-                import pandas_datareader.data as web
-                
                 # 正しいシンボル形式に変換
                 if symbol.endswith('.T'):
                     # 日本株の場合: 7203.T -> 7203.JP
@@ -266,28 +775,31 @@ class DataLoader:
                     stooq_symbol = f"{symbol}.US"
                 
                 # 間隔の変換
-                interval_map = {
-                    "1d": "d",  # 日足
-                    "1wk": "w",  # 週足
-                    "1mo": "m",  # 月足
-                }
-                stooq_interval = interval_map.get(interval, "d")
+                stooq_interval = STOOQ_INTERVALS.get(interval, "d")
                 
                 self.logger.info(f"stooq.comからデータ取得: {symbol} -> {stooq_symbol}")
                 
-                # データ取得
-                data = web.DataReader(
-                    stooq_symbol, 
-                    data_source='stooq', 
-                    start=start_date, 
-                    end=end_date
-                )
+                # データ取得（共有セッションでCSVを直接取得。requestsがない場合はpandas-datareader経由）
+                session = self._get_session()
+                if session is not None:
+                    data = self._read_stooq_csv(session, stooq_symbol, stooq_interval, start_date, end_date)
+                else:
+                    web = _import_datareader()
+                    data = web.DataReader(
+                        stooq_symbol, 
+                        data_source='stooq', 
+                        start=start_date, 
+                        end=end_date
+                    )
                 
                 if not data.empty:
                     # カラム名の統一
                     if 'Adj Close' in data.columns:
                         data = data.drop('Adj Close', axis=1)
                     
+                    # 列の型を明示（型推論でobject列になった場合も数値配列に揃える）
+                    data = data.astype({column: 'float64' for column in REQUIRED_COLUMNS if column in data.columns})
+                    
                     # 日付順にソート
                     data = data.sort_index()
                     
@@ -304,6 +816,36 @@ class DataLoader:
             self.logger.warning(f"stooq.com エラー: {symbol}, {e}")
             return pd.DataFrame()
     
+    def _read_stooq_csv(self, session, stooq_symbol: str, stooq_interval: str,
+                        start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        stooq.comのCSVダウンロードからデータを取得
+        
+        Args:
+            session: HTTPセッション
+            stooq_symbol: stooq.com形式のシンボル（例: AAPL.US, 7203.JP）
+            stooq_interval: stooq.com形式の間隔（d, w, m）
+            start_date: 開始日
+            end_date: 終了日
+        
+        Returns:
+            DataFrame: 株価データ（日付インデックス。データがない場合は空）
+        """
+        start_ts, end_ts = _resolve_dates(start_date, end_date)
+        response = session.get(STOOQ_CSV_URL, params={
+            's': stooq_symbol.lower(),
+            'i': stooq_interval,
+            'd1': start_ts.strftime('%Y%m%d'),
+            'd2': end_ts.strftime('%Y%m%d'),
+        }, timeout=STOOQ_TIMEOUT)
+        response.raise_for_status()
+        
+        # データがない銘柄・期間はCSVではなく「No data」などの本文が返る
+        if not response.content.startswith(b'Date,'):
+            return pd.DataFrame()
+        
+        return pd.read_csv(io.BytesIO(response.content), index_col='Date', parse_dates=['Date'])
+    
     def get_test_stocks(self) -> List[str]:
         """テスト用銘柄リスト"""
         return ['AAPL', 'MSFT', 'GOOGL']
@@ -329,20 +871,29 @@ class DataLoader:
         """
         cache_file = os.path.join(self.cache_dir, f"VIX_1d_{start_date}_{end_date}.pkl")
         
-        # 既存のキャッシュデータを読み込み
+        # 既存のキャッシュデータを読み込み（同じ期間のファイルがない場合は別期間のファイルから）
         existing_data = pd.DataFrame()
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'rb') as f:
-                    existing_data = pickle.load(f)
-                if not existing_data.empty:
-                    self.logger.info(f"VIXキャッシュデータを読み込み: {existing_data.shape}")
-                    return existing_data
-            except Exception as e:
-                self.logger.warning(f"VIXキャッシュ読み込みエラー: {e}")
+        try:
+            existing_data = self._read_cache(cache_file)
+            if not existing_data.empty:
+                self.logger.info(f"VIXキャッシュデータを読み込み: {existing_data.shape}")
+                return existing_data
+        except FileNotFoundError:
+            existing_data = self._read_overlapping_cache("VIX", "1d", start_date, end_date)
+        except Exception as e:
+            self.logger.warning(f"VIXキャッシュ読み込みエラー: {e}")
         
         # 差分取得を試行
         missing_periods = self._get_missing_periods(existing_data, start_date, end_date)
+        if not missing_periods:
+            # 別期間のキャッシュで要求期間が揃っている場合
+            try:
+                self._write_cache(existing_data, cache_file)
+                self.logger.info(f"VIXデータをキャッシュに保存: {cache_file}")
+            except Exception as e:
+                self.logger.warning(f"VIXキャッシュ保存エラー: {e}")
+            return existing_data
+        
         if missing_periods:
             self.logger.info(f"VIX差分取得期間: {missing_periods}")
             new_data = self._fetch_vix_data_periods(missing_periods)
@@ -355,8 +906,7 @@ class DataLoader:
                 
                 # キャッシュに保存
                 try:
-                    with open(cache_file, 'wb') as f:
-                        pickle.dump(merged_data, f)
+                    self._write_cache(merged_data, cache_file)
                     self.logger.info(f"VIXデータをキャッシュに保存: {cache_file}")
                 except Exception as e:
                     self.logger.warning(f"VIXキャッシュ保存エラー: {e}")
@@ -399,8 +949,7 @@ class DataLoader:
             
             # キャッシュに保存
             try:
-                with open(cache_file, 'wb') as f:
-                    pickle.dump(vix, f)
+                self._write_cache(vix, cache_file)
                 self.logger.info(f"VIXデータをキャッシュに保存: {cache_file}")
             except Exception as e:
                 self.logger.warning(f"VIXキャッシュ保存エラー: {e}")
@@ -417,7 +966,7 @@ class DataLoader:
     
     def _fetch_vix_data_periods(self, periods: List[tuple]) -> pd.DataFrame:
         """
-        指定期間のVIXデータを取得
+        指定期間のVIXデータを取得（複数期間は並列で取得）
         
         Args:
             periods: 取得期間のリスト [(start_date, end_date), ...]
@@ -425,45 +974,14 @@ class DataLoader:
         Returns:
             DataFrame: VIXデータ
         """
-        all_data = []
+        if len(periods) > 1:
+            # 期間ごとの取得は独立したHTTP通信のため並列で待つ（結果は期間の順）
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_workers, len(periods))) as executor:
+                parts = list(executor.map(lambda period: self._fetch_vix_period(*period), periods))
+        else:
+            parts = [self._fetch_vix_period(start_date, end_date) for start_date, end_date in periods]
         
-        for start_date, end_date in periods:
-            try:
-                import yfinance as yf
-                
-                # VIXデータを取得（複数のシンボルを試行）
-                vix_symbols = ["^VIX", "VIX", "VIXCLS"]
-                vix = pd.DataFrame()
-                
-                for symbol in vix_symbols:
-                    try:
-                        self.logger.info(f"VIX差分取得試行: {symbol} ({start_date} - {end_date})")
-                        vix = yf.download(symbol, start=start_date, end=end_date, progress=False)
-                        if not vix.empty:
-                            self.logger.info(f"VIX差分取得成功: {symbol}")
-                            break
-                    except Exception as e:
-                        self.logger.warning(f"VIX差分取得失敗: {symbol}, {e}")
-                        continue
-                
-                if not vix.empty:
-                    # カラム名を統一
-                    if len(vix.columns) == 6:  # Adj Closeが含まれている場合
-                        vix.columns = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
-                        vix = vix.drop('Adj Close', axis=1)
-                    elif len(vix.columns) == 5:  # Adj Closeが含まれていない場合
-                        vix.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-                    
-                    all_data.append(vix)
-                else:
-                    # データが取得できない場合はシミュレート
-                    simulated_vix = self._simulate_vix_data(start_date, end_date)
-                    if not simulated_vix.empty:
-                        all_data.append(simulated_vix)
-                    
-            except Exception as e:
-                self.logger.error(f"VIX差分取得エラー ({start_date} - {end_date}): {e}")
-                continue
+        all_data = [part for part in parts if not part.empty]
         
         if all_data:
             # 全データを結合
@@ -474,6 +992,53 @@ class DataLoader:
         
         return pd.DataFrame()
     
+    def _fetch_vix_period(self, start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        1期間分のVIXデータを取得（取得できない場合はシミュレート）
+        
+        Args:
+            start_date: 開始日
+            end_date: 終了日
+        
+        Returns:
+            DataFrame: VIXデータ（エラー時は空）
+        """
+        try:
+            import yfinance as yf
+            
+            # VIXデータを取得（複数のシンボルを試行）
+            vix_symbols = ["^VIX", "VIX", "VIXCLS"]
+            vix = pd.DataFrame()
+            
+            for symbol in vix_symbols:
+                try:
+                    self.logger.info(f"VIX差分取得試行: {symbol} ({start_date} - {end_date})")
+                    # 期間ごとに並列で呼ぶため、yfinance側ではスレッドを起動しない
+                    vix = yf.download(symbol, start=start_date, end=end_date, progress=False, threads=False)
+                    if not vix.empty:
+                        self.logger.info(f"VIX差分取得成功: {symbol}")
+                        break
+                except Exception as e:
+                    self.logger.warning(f"VIX差分取得失敗: {symbol}, {e}")
+                    continue
+            
+            if not vix.empty:
+                # カラム名を統一
+                if len(vix.columns) == 6:  # Adj Closeが含まれている場合
+                    vix.columns = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
+                    vix = vix.drop('Adj Close', axis=1)
+                elif len(vix.columns) == 5:  # Adj Closeが含まれていない場合
+                    vix.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
+                
+                return vix
+            
+            # データが取得できない場合はシミュレート
+            return self._simulate_vix_data(start_date, end_date)
+            
+        except Exception as e:
+            self.logger.error(f"VIX差分取得エラー ({start_date} - {end_date}): {e}")
+            return pd.DataFrame()
+    
     def _simulate_vix_data(self, start_date: str, end_date: str) -> pd.DataFrame:
         """
         VIXデータをシミュレート（実際のデータが取得できない場合の代替手段）
@@ -486,56 +1051,46 @@ class DataLoader:
             DataFrame: シミュレートされたVIXデータ
         """
         try:
-            import numpy as np
-            
             # 日付範囲を生成
             date_range = pd.date_range(start=start_date, end=end_date, freq='D')
             
             # 土日を除外（営業日のみ）
             business_days = date_range[date_range.weekday < 5]
+            n = len(business_days)
             
             # VIX値をシミュレート（現実的な範囲で）
-            np.random.seed(42)  # 再現性のため
+            rng = np.random.default_rng(42)  # 再現性のため
             
             # ベースラインVIX値（通常は15-25の範囲）
             base_vix = 20
             
-            # 期間別のVIXレベル調整
-            vix_values = []
-            for date in business_days:
-                year = date.year
-                month = date.month
-                
-                # 2020年3月-4月（COVID-19）: 高VIX
-                if year == 2020 and month in [3, 4]:
-                    vix = base_vix + np.random.normal(40, 15)  # 平均60, 標準偏差15
-                # 2008年9月-10月（金融危機）: 高VIX
-                elif year == 2008 and month in [9, 10]:
-                    vix = base_vix + np.random.normal(35, 20)  # 平均55, 標準偏差20
-                # 2022年2月-3月（ウクライナ侵攻）: 中程度のVIX
-                elif year == 2022 and month in [2, 3]:
-                    vix = base_vix + np.random.normal(15, 10)  # 平均35, 標準偏差10
-                # 通常期間
-                else:
-                    vix = base_vix + np.random.normal(0, 8)  # 平均20, 標準偏差8
-                
-                # VIX値の範囲制限（5-100）
-                vix = max(5, min(100, vix))
-                vix_values.append(vix)
+            # 期間別のVIXレベル調整（平均・標準偏差を日ごとに割り当てて一括生成）
+            years = business_days.year.to_numpy()
+            months = business_days.month.to_numpy()
+            regimes = [
+                # 2020年3月-4月（COVID-19）: 高VIX（平均60, 標準偏差15）
+                ((years == 2020) & np.isin(months, [3, 4]), 40, 15),
+                # 2008年9月-10月（金融危機）: 高VIX（平均55, 標準偏差20）
+                ((years == 2008) & np.isin(months, [9, 10]), 35, 20),
+                # 2022年2月-3月（ウクライナ侵攻）: 中程度のVIX（平均35, 標準偏差10）
+                ((years == 2022) & np.isin(months, [2, 3]), 15, 10),
+            ]
+            # 通常期間: 平均20, 標準偏差8
+            mean = np.select([mask for mask, _, _ in regimes], [m for _, m, _ in regimes], default=0)
+            std = np.select([mask for mask, _, _ in regimes], [sd for _, _, sd in regimes], default=8)
             
-            # DataFrameを作成
+            # VIX値の範囲制限（5-100）
+            vix_values = np.clip(base_vix + rng.normal(mean, std), 5, 100)
+            
+            # DataFrameを作成（High/LowはOpen/Closeを必ず包含する）
             vix_data = pd.DataFrame({
                 'Open': vix_values,
-                'High': [v + np.random.uniform(0, 5) for v in vix_values],
-                'Low': [v - np.random.uniform(0, 5) for v in vix_values],
+                'High': vix_values + rng.uniform(0, 5, n),
+                'Low': vix_values - rng.uniform(0, 5, n),
                 'Close': vix_values,
-                'Volume': [np.random.randint(1000000, 10000000) for _ in vix_values]
+                'Volume': rng.integers(1000000, 10000000, n)
             }, index=business_days)
             
-            # High/Lowの調整
-            vix_data['High'] = vix_data[['Open', 'High', 'Close']].max(axis=1)
-            vix_data['Low'] = vix_data[['Open', 'Low', 'Close']].min(axis=1)
-            
             self.logger.info(f"VIXデータをシミュレート: {vix_data.shape}")
             return vix_data
             
@@ -554,29 +1109,103 @@ class DataLoader:
             DataFrame: 指数別銘柄情報
         """
         try:
-            if not os.path.exists(csv_file):
+            try:
+                entry = self._index_stocks_entry(csv_file)
+            except FileNotFoundError:
                 self.logger.warning(f"指数銘柄CSVファイルが見つかりません: {csv_file}")
                 # デフォルトの銘柄リストを返す
-                default_stocks = pd.DataFrame({
-                    'symbol': ['AAPL', 'MSFT', 'GOOGL', '7203.T', '6758.T', '9984.T'],
-                    'name': ['Apple Inc.', 'Microsoft Corporation', 'Alphabet Inc.', 
-                            'トヨタ自動車株式会社', 'ソニーグループ株式会社', 'ソフトバンクグループ株式会社'],
-                    'index': ['SP500', 'SP500', 'SP500', 'NIKKEI225', 'NIKKEI225', 'NIKKEI225'],
-                    'category': ['high', 'high', 'high', 'high', 'high', 'high'],
-                    'country': ['US', 'US', 'US', 'JP', 'JP', 'JP'],
-                    'description': ['テクノロジー大手', 'ソフトウェア大手', 'インターネット大手', 
-                                   '自動車大手', 'エンターテイメント大手', '通信大手']
-                })
-                return default_stocks
-            
-            stocks_df = pd.read_csv(csv_file, encoding='utf-8')
-            self.logger.info(f"指数銘柄CSVファイルから読み込み: {len(stocks_df)}銘柄")
-            return stocks_df
+                return DEFAULT_INDEX_STOCKS.copy(deep=False)
+            
+            # 呼び出し元での列の追加・代入が読み込み結果のキャッシュに波及しないようにする
+            return entry[1].copy(deep=False)
             
         except Exception as e:
             self.logger.error(f"指数銘柄CSVファイル読み込みエラー: {e}")
-            # エラー時はデフォルトの銘柄リストを返す
-            return self.load_index_stocks_from_csv("index_stocks.csv")
+            # エラー時は既定のCSVを読み込む（既定のCSV自体が読めない場合はデフォルトの銘柄リスト。
+            # 同じファイルを読み直して再帰し続けないようにする）
+            if csv_file != "index_stocks.csv":
+                return self.load_index_stocks_from_csv("index_stocks.csv")
+            return DEFAULT_INDEX_STOCKS.copy(deep=False)
+    
+    def _index_stocks_entry(self, csv_file: str) -> Tuple[int, pd.DataFrame, Dict[str, List[str]]]:
+        """
+        指数銘柄CSVの読み込み結果を取得（更新されていなければ前回の読み込み結果を再利用）
+        
+        Args:
+            csv_file: CSVファイルパス
+        
+        Returns:
+            Tuple: (CSVの更新時刻, 指数別銘柄情報, 指数別の銘柄リスト)（キャッシュと共有されるため変更しないこと）
+        
+        Raises:
+            FileNotFoundError: CSVファイルが存在しない場合
+        """
+        mtime_ns = os.stat(csv_file).st_mtime_ns
+        cached = self._index_stocks_cache.get(csv_file)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached
+        
+        stocks_df = self._read_index_stocks(csv_file, mtime_ns)
+        symbols_by_index = {
+            index_name: symbols.tolist()
+            for index_name, symbols in stocks_df.groupby('index', sort=False)['symbol']
+        }
+        entry = (mtime_ns, stocks_df, symbols_by_index)
+        self._index_stocks_cache[csv_file] = entry
+        self.logger.info(f"指数銘柄CSVファイルから読み込み: {len(stocks_df)}銘柄")
+        return entry
+    
+    def _read_index_stocks(self, csv_file: str, csv_mtime_ns: int) -> pd.DataFrame:
+        """
+        指数銘柄CSVを読み込み
+        
+        CSVより新しいFeather（同名の.feather）があれば、メモリマップして読み込む
+        （型変換・文字列解析が不要）。ない場合はCSVを読み込む。
+        
+        Args:
+            csv_file: CSVファイルパス
+            csv_mtime_ns: CSVファイルの更新時刻
+        
+        Returns:
+            DataFrame: 指数別銘柄情報
+        """
+        feather_file = os.path.splitext(csv_file)[0] + '.feather'
+        use_feather = False
+        if feather is not None:
+            try:
+                use_feather = os.stat(feather_file).st_mtime_ns >= csv_mtime_ns
+            except FileNotFoundError:
+                pass
+        
+        if use_feather:
+            try:
+                return feather.read_table(feather_file, memory_map=True).to_pandas()
+            except Exception as e:
+                self.logger.warning(f"指数銘柄Feather読み込みエラー、CSVを使用: {feather_file}, {e}")
+        
+        return _read_stocks_csv(csv_file)
+    
+    def convert_index_stocks_to_feather(self, csv_file: str = "index_stocks.csv") -> str:
+        """
+        指数銘柄CSVをFeather形式に変換
+        
+        load_index_stocks_from_csvは同名の.featherがCSVより新しければ優先して読み込む。
+        メモリマップで直接参照できるよう圧縮せずに書き込む。
+        
+        Args:
+            csv_file: CSVファイルパス
+        
+        Returns:
+            str: 出力したFeatherファイルのパス
+        """
+        if feather is None:
+            raise ImportError("pyarrowがインストールされていません")
+        
+        feather_file = os.path.splitext(csv_file)[0] + '.feather'
+        stocks_df = _read_stocks_csv(csv_file)
+        feather.write_feather(stocks_df, feather_file, compression='uncompressed')
+        self.logger.info(f"指数銘柄CSVをFeatherに変換: {feather_file} ({len(stocks_df)}銘柄)")
+        return feather_file
     
     def get_stocks_by_index(self, index_name: str) -> List[str]:
         """
@@ -588,9 +1217,30 @@ class DataLoader:
         Returns:
             List[str]: 銘柄シンボルリスト
         """
-        stocks_df = self.load_index_stocks_from_csv()
-        index_stocks = stocks_df[stocks_df['index'] == index_name]
-        symbols = index_stocks['symbol'].tolist()
+        return list(self._index_symbols(index_name))
+    
+    def _index_symbols(self, index_name: str) -> List[str]:
+        """
+        指定された指数の銘柄リストを取得（読み込み結果のリストをコピーせずに返す）
+        
+        Args:
+            index_name: 指数名
+        
+        Returns:
+            List[str]: 銘柄シンボルリスト（呼び出し元では変更しないこと）
+        """
+        # CSVから読み込めた場合は指数別に振り分け済みのリストを使う
+        try:
+            entry = self._index_stocks_entry("index_stocks.csv")
+        except Exception:
+            entry = None
+        
+        if entry is not None:
+            symbols = entry[2].get(index_name, [])
+        else:
+            # CSVがない・読めない場合はデフォルトの銘柄リストから抽出
+            stocks_df = self.load_index_stocks_from_csv()
+            symbols = stocks_df.loc[stocks_df['index'] == index_name, 'symbol'].tolist()
         self.logger.info(f"指数銘柄リスト取得: {index_name}, 銘柄数={len(symbols)}")
         return symbols
     
@@ -623,16 +1273,18 @@ class DataLoader:
         """
         import random
         
-        if random_seed is not None:
-            random.seed(random_seed)
+        # シード指定時は呼び出しごとの乱数生成器を使う（並列呼び出しでもグローバル状態を共有しない。
+        # 同じシードのrandom.seed + random.sampleと同じ結果になる）
+        rng = random.Random(random_seed) if random_seed is not None else random
         
-        all_stocks = self.get_stocks_by_index(index_name)
+        # random.sampleは入力を変更しないため、読み込み済みのリストをそのまま使う
+        all_stocks = self._index_symbols(index_name)
         
         if len(all_stocks) < sample_size:
             self.logger.warning(f"指数 {index_name} の銘柄数({len(all_stocks)})が要求数({sample_size})より少ないため、全銘柄を使用")
-            return all_stocks
+            return list(all_stocks)
         
-        sampled_stocks = random.sample(all_stocks, sample_size)
+        sampled_stocks = rng.sample(all_stocks, sample_size)
         self.logger.info(f"指数 {index_name} から {sample_size} 銘柄をランダム抽出: {sampled_stocks}")
         return sampled_stocks
     
@@ -718,14 +1370,15 @@ class DataLoader:
         """
         metadata_file = os.path.join(self.cache_dir, "fetch_metadata.json")
         
-        if os.path.exists(metadata_file):
-            try:
-                import json
-                with open(metadata_file, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
-                return metadata
-            except Exception as e:
-                self.logger.warning(f"メタデータ読み込みエラー: {e}")
+        try:
+            import json
+            with open(metadata_file, 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
+            return metadata
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"メタデータ読み込みエラー: {e}")
         
         return {}
     
@@ -819,7 +1472,8 @@ class DataLoader:
             # 並列実行
             future_to_symbol = {executor.submit(get_data_func, symbol): symbol for symbol in symbols}
             
-            results = {}
+            # 完了順ではなく入力順の辞書にする（キーを先に登録し、完了時は値の差し替えのみ）
+            results = dict.fromkeys(symbols)
             completed = 0
             
             for future in concurrent.futures.as_completed(future_to_symbol):
@@ -866,35 +1520,34 @@ class DataLoader:
         for symbol in symbols:
             cache_file = os.path.join(self.cache_dir, f"{symbol}_{interval}_{start_date}_{end_date}.pkl")
             
-            if not os.path.exists(cache_file):
+            try:
+                cache_range = self._peek_cache_range(cache_file)
+            except FileNotFoundError:
                 # キャッシュファイルが存在しない場合
                 target_symbols.append(symbol)
                 self.logger.info(f"未取得銘柄を追加: {symbol}")
+                continue
+            except Exception as e:
+                # キャッシュファイルの読み込みエラーの場合
+                target_symbols.append(symbol)
+                self.logger.warning(f"キャッシュ読み込みエラー銘柄を追加: {symbol}, {e}")
+                continue
+            
+            # キャッシュファイルが存在する場合、データの完全性をチェック
+            if cache_range is None:
+                # 空のデータの場合
+                target_symbols.append(symbol)
+                self.logger.info(f"空データ銘柄を追加: {symbol}")
             else:
-                # キャッシュファイルが存在する場合、データの完全性をチェック
-                try:
-                    with open(cache_file, 'rb') as f:
-                        existing_data = pickle.load(f)
-                    
-                    if existing_data.empty:
-                        # 空のデータの場合
-                        target_symbols.append(symbol)
-                        self.logger.info(f"空データ銘柄を追加: {symbol}")
-                    else:
-                        # データの完全性をチェック
-                        missing_periods = self._get_missing_periods(existing_data, start_date, end_date)
-                        if missing_periods:
-                            # 不完全データの場合
-                            target_symbols.append(symbol)
-                            self.logger.info(f"不完全データ銘柄を追加: {symbol} (不足期間: {len(missing_periods)}個)")
-                        else:
-                            # 完全なデータの場合
-                            self.logger.info(f"完全データ銘柄をスキップ: {symbol}")
-                            
-                except Exception as e:
-                    # キャッシュファイルの読み込みエラーの場合
+                # データの完全性をチェック（期間のみで判定し、データ本体は取得時に読み込む）
+                missing_periods = self._get_missing_periods_for_range(*cache_range, start_date, end_date)
+                if missing_periods:
+                    # 不完全データの場合
                     target_symbols.append(symbol)
-                    self.logger.warning(f"キャッシュ読み込みエラー銘柄を追加: {symbol}, {e}")
+                    self.logger.info(f"不完全データ銘柄を追加: {symbol} (不足期間: {len(missing_periods)}個)")
+                else:
+                    # 完全なデータの場合
+                    self.logger.info(f"完全データ銘柄をスキップ: {symbol}")
         
         if not target_symbols:
             self.logger.info("取得対象の銘柄がありません（すべて完全なデータが存在）")
@@ -915,7 +1568,8 @@ class DataLoader:
             # 並列実行
             future_to_symbol = {executor.submit(get_data_func, symbol): symbol for symbol in target_symbols}
             
-            results = {}
+            # 完了順ではなく入力順の辞書にする（キーを先に登録し、完了時は値の差し替えのみ）
+            results = dict.fromkeys(target_symbols)
             completed = 0
             
             for future in concurrent.futures.as_completed(future_to_symbol):
@@ -3,6 +3,7 @@
 """
 
 import os
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
@@ -890,19 +891,16 @@ class ReportGenerator:
     
     def _create_drawdown_chart(self, equity_data: Dict, date_range: Dict = None) -> str:
         """ドローダウンチャート"""
-        equity_series = pd.Series(
-            equity_data["values"],
-            index=pd.to_datetime(equity_data["dates"])
-        )
-        
-        rolling_max = equity_series.expanding().max()
-        drawdown = (equity_series - rolling_max) / rolling_max * 100
+        # 累積最大値からの下落率をNumPyで一括計算
+        equity = np.asarray(equity_data["values"], dtype=float)
+        running_max = np.maximum.accumulate(equity)
+        drawdown = (equity - running_max) / running_max * 100
         
         fig = go.Figure()
         
         fig.add_trace(go.Scatter(
-            x=drawdown.index,
-            y=drawdown.values,
+            x=pd.to_datetime(equity_data["dates"]),
+            y=drawdown,
             fill='tonexty',
             fillcolor='rgba(255,0,0,0.3)',
             line=dict(color='red'),
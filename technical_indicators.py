@@ -40,6 +40,22 @@ class TechnicalIndicators:
         
         return data
     
+    def has_all_indicators(self, data: pd.DataFrame) -> bool:
+        """
+        calculate_all_indicatorsで計算される指標が既に揃っているかを確認
+        
+        Args:
+            data: 株価データ
+        
+        Returns:
+            bool: 各指標グループの列が全て存在する場合True
+        """
+        required_columns = [
+            f'SMA_{self.params["sma_long"]}', 'RSI', 'Volume_Ratio',
+            'VWAP', 'BB_Lower', 'MACD_Signal'
+        ]
+        return all(column in data.columns for column in required_columns)
+    
     def _calculate_moving_averages(self, data: pd.DataFrame) -> pd.DataFrame:
         """移動平均線の計算"""
         try:
@@ -228,7 +244,22 @@ class TechnicalIndicators:
         if data.empty:
             return {"exit": False, "reason": "no_data"}
         
-        latest = data.iloc[-1]
+        return self.check_exit_conditions_for_row(data.iloc[-1], strategy, entry_price, current_price)
+    
+    def check_exit_conditions_for_row(self, latest, strategy: str,
+                                      entry_price: float, current_price: float) -> Dict[str, bool]:
+        """
+        判定に使う行を指定したエグジット条件のチェック
+        
+        Args:
+            latest: 判定に使う行（列名で参照できるSeriesまたは辞書）
+            strategy: 戦略名
+            entry_price: エントリー価格
+            current_price: 現在価格
+        
+        Returns:
+            Dict: エグジット条件の判定結果
+        """
         price_change = (current_price - entry_price) / entry_price
         
         exit_conditions = {
@@ -5,11 +5,16 @@
 import os
 import sys
 import logging
+import tempfile
 from datetime import datetime, timedelta
 
-from data_loader import DataLoader
+import numpy as np
+import pandas as pd
+
+from data_loader import DataLoader, pa
 from technical_indicators import TechnicalIndicators
 from backtest_engine import BacktestEngine
+from backtest_aggregator import BacktestAggregator
 from report_generator import ReportGenerator
 from wfo_optimizer import WFOptimizer
 
@@ -112,6 +117,146 @@ def test_backtest_engine():
     
     print()
 
+def test_position_sizing():
+    """複数ポジション保有時のポジションサイズ計算のテスト（データ取得なしで確定的に検証）"""
+    print("=== ポジションサイズ計算テスト ===")
+    
+    engine = BacktestEngine("long_term")
+    portfolio = engine.portfolio
+    date = datetime(2023, 6, 1)
+    
+    # 保有中の2銘柄（建値より値上がり済み）と現金400万円
+    portfolio.add_position("AAA", 1000, 3000.0, date - timedelta(days=30), "long_term", "test")
+    portfolio.add_position("BBB", 500, 2000.0, date - timedelta(days=30), "long_term", "test")
+    portfolio.cash = 4000000.0
+    
+    # 当日終値: 保有銘柄は時価400万円・200万円、新規候補は1000円・700円
+    symbols = ["AAA", "BBB", "CCC", "DDD"]
+    close_row = np.array([4000.0, 4000.0, 1000.0, 700.0])
+    available_row = np.ones(len(symbols), dtype=bool)
+    entry_row = np.array([False, False, True, True])
+    
+    # エグジット判定用の行を渡さず、エントリーのみを処理
+    engine._process_date(date, {}, symbols, close_row, available_row, entry_row)
+    
+    # 総資産価値は現金＋保有銘柄の時価（400万 + 400万 + 200万 = 1000万円）
+    total_value = 10000000.0
+    risk_amount = total_value * engine.risk_per_trade
+    expected_ccc = int(risk_amount / 1000.0)
+    expected_ddd = int(risk_amount / 700.0)
+    
+    assert portfolio.positions["CCC"]["quantity"] == expected_ccc, portfolio.positions["CCC"]
+    assert portfolio.positions["DDD"]["quantity"] == expected_ddd, portfolio.positions["DDD"]
+    assert portfolio.cash == 4000000.0 - expected_ccc * 1000.0 - expected_ddd * 700.0
+    assert portfolio.equity_curve[-1] == total_value
+    
+    print("  ✓ ポジションサイズ計算成功")
+    print(f"    CCC: {expected_ccc}株, DDD: {expected_ddd}株（総資産価値 {total_value:,.0f}円基準）")
+    print()
+
+def test_run_summary():
+    """実行サマリー（summary.jsonl）の追記・読み込みのテスト"""
+    print("=== 実行サマリーテスト ===")
+    
+    with tempfile.TemporaryDirectory() as results_dir:
+        aggregator = BacktestAggregator(results_dir)
+        
+        results = {
+            "total_return": np.float64(0.12),
+            "total_trades": np.int64(8),
+            "win_rate": 0.5,
+            "error": None,
+            "trades": [{"symbol": "7203.T", "profit_loss": 1000}],
+            "equity_curve": {"dates": ["2023-01-01"], "values": [10000000]}
+        }
+        first = aggregator.save_individual_result("swing_trading", 2, 42, ["7203.T"], results)
+        second = aggregator.save_individual_result("swing_trading", 1, 7, ["6758.T"], results)
+        aggregator.save_individual_result("long_term", 1, 42, ["9984.T"], results)
+        
+        summaries = aggregator.load_run_summaries("swing_trading")
+        
+        # 実行ID順に並び、結果はスカラー指標のみ（numpy型はPythonの値に変換）
+        assert [s["run_id"] for s in summaries] == [1, 2], summaries
+        assert summaries[0]["file"] == os.path.basename(second)
+        assert summaries[0]["stocks"] == ["6758.T"]
+        assert summaries[0]["results"] == {
+            "total_return": 0.12, "total_trades": 8, "win_rate": 0.5, "error": None
+        }
+        
+        # 個別結果ファイルが削除された実行は対象外
+        os.remove(first)
+        summaries = aggregator.load_run_summaries("swing_trading")
+        assert [s["run_id"] for s in summaries] == [1], summaries
+        
+        summary_path = os.path.join(results_dir, "individual", BacktestAggregator.SUMMARY_FILENAME)
+        with open(summary_path, encoding="utf-8") as f:
+            assert len(f.readlines()) == 3
+    
+    print("  ✓ 実行サマリー追記・読み込み成功")
+    print()
+
+def test_cache_merge():
+    """別期間のキャッシュの再利用と差分取得のマージのテスト（取得処理を差し替えて確定的に検証）"""
+    print("=== キャッシュ再利用・差分マージテスト ===")
+    
+    # 取得元のデータ（2021年の営業日、値は日ごとに異なる）
+    dates = pd.bdate_range("2021-01-01", "2021-12-31")
+    values = np.arange(len(dates), dtype=float)
+    source = pd.DataFrame({
+        "Open": values, "High": values + 2, "Low": values - 2,
+        "Close": values + 1, "Volume": values * 100
+    }, index=dates)
+    
+    def stub_fetcher(calls):
+        def fetch(symbol, start_date, end_date, interval="1d", max_retries=3):
+            calls.append((symbol, start_date, end_date))
+            # キャッシュ済み期間の内側は異なる値を返し、マージ結果がキャッシュの値を使うことを確認する
+            fetched = source.loc[start_date:end_date].copy()
+            fetched.loc["2021-04-02":"2021-09-29", "Close"] = -1.0
+            return fetched
+        return fetch
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        data_loader = DataLoader(cache_dir=cache_dir)
+        
+        # 4月〜9月のキャッシュのみ存在する状態で通年を要求
+        data_loader._write_cache(
+            source.loc["2021-04-01":"2021-09-30"].copy(),
+            os.path.join(cache_dir, "TEST_1d_2021-04-01_2021-09-30.pkl")
+        )
+        calls = []
+        data_loader._get_from_stooq = stub_fetcher(calls)
+        data = data_loader.get_stock_data("TEST", "2021-01-01", "2021-12-31")
+        
+        # 前後の不足期間は1回の取得にまとめられ、境界日（既存データの両端）も重複しない
+        assert calls == [("TEST", "2021-01-01", "2021-12-31")], calls
+        pd.testing.assert_frame_equal(data, source, check_freq=False)
+        for boundary in ("2021-04-01", "2021-09-30"):
+            pd.testing.assert_series_equal(data.loc[boundary], source.loc[boundary])
+        
+        # 要求期間のファイル名で保存される
+        cache_file = os.path.join(cache_dir, "TEST_1d_2021-01-01_2021-12-31.pkl")
+        pd.testing.assert_frame_equal(pd.read_pickle(cache_file), source, check_freq=False)
+        if pa is not None:
+            # pyarrowが利用可能な場合は同名のArrow IPCファイルも書き込まれる
+            arrow_file = cache_file[:-len(".pkl")] + ".arrow"
+            pd.testing.assert_frame_equal(pd.read_feather(arrow_file), source, check_freq=False)
+        
+        # 別期間のファイルで要求期間を賄える場合は取得しない
+        data_loader = DataLoader(cache_dir=cache_dir)
+        calls = []
+        data_loader._get_from_stooq = stub_fetcher(calls)
+        data = data_loader.get_stock_data("TEST", "2021-05-03", "2021-08-31")
+        
+        assert calls == [], calls
+        expected = source.loc["2021-05-03":"2021-08-31"]
+        pd.testing.assert_frame_equal(data, expected, check_freq=False)
+        cache_file = os.path.join(cache_dir, "TEST_1d_2021-05-03_2021-08-31.pkl")
+        pd.testing.assert_frame_equal(pd.read_pickle(cache_file), expected, check_freq=False)
+    
+    print("  ✓ キャッシュ再利用・差分マージ成功")
+    print()
+
 def test_report_generator():
     """レポート生成のテスト"""
     print("=== レポート生成テスト ===")
@@ -207,6 +352,9 @@ def main():
     test_data_loader()
     test_technical_indicators()
     test_backtest_engine()
+    test_position_sizing()
+    test_run_summary()
+    test_cache_merge()
     test_report_generator()
     test_wfo_optimizer()
     
@@ -362,6 +362,7 @@ class WFOptimizer:
         
         # JSON形式で保存
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(wfo_results, f, indent=2, ensure_ascii=False, default=str)
+            json.dump(wfo_results, f, indent=2, ensure_ascii=False,
+                      default=lambda obj: obj.tolist() if isinstance(obj, np.ndarray) else str(obj))
         
         self.logger.info(f"WFO結果保存: {filename}")